@@ -0,0 +1,147 @@
+"""Замеры маршрутов блога: число запросов, задержка и размер ответа.
+
+Запуск: ``pytest benchmarks``. Переменные окружения:
+
+* BLOG_BENCH_PROFILE — размер набора данных из PROFILES (small);
+* BLOG_BENCH_POSTS, BLOG_BENCH_COMMENTS, BLOG_BENCH_USERS — переопределяют
+  размеры профиля;
+* BLOG_BENCH_RUNS — число замеров на маршрут (20);
+* BLOG_BENCH_STRICT_LATENCY=1 — проверять и задержки, а не только
+  запросы и размер ответа;
+* BLOG_BENCH_LATENCY_TOLERANCE — допустимый рост p95 в долях (1.0);
+* BLOG_BENCH_UPDATE=1 — записать результаты как новые базовые.
+
+Базовые значения лежат в baselines/<профиль>.json; рост числа запросов
+или размера ответа больше чем на BYTES_TOLERANCE проваливает прогон.
+Задержки зависят от машины, поэтому p95 сверх допуска и сравнения
+времени внутри прогона проверяются только с BLOG_BENCH_STRICT_LATENCY.
+"""
+import json
+import os
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+
+PROFILES = {
+    'small': {'posts': 2000, 'comments': 20000, 'users': 200},
+    'full': {'posts': 100000, 'comments': 1000000, 'users': 10000},
+}
+BASELINES_DIR = Path(__file__).parent / 'baselines'
+BYTES_TOLERANCE = 0.1
+# Абсолютный запас p95 в секундах: быстрые маршруты сильно шумят.
+LATENCY_SLACK = 0.005
+
+
+def _profile():
+    name = os.environ.get('BLOG_BENCH_PROFILE', 'small')
+    sizes = dict(PROFILES.get(name, PROFILES['small']))
+    for key in sizes:
+        sizes[key] = int(
+            os.environ.get(f'BLOG_BENCH_{key.upper()}', sizes[key])
+        )
+    return name, sizes
+
+
+def pytest_configure(config):
+    config.blog_bench_profile, config.blog_bench_sizes = _profile()
+    config.blog_bench_baseline_path = (
+        BASELINES_DIR / f'{config.blog_bench_profile}.json'
+    )
+    path = config.blog_bench_baseline_path
+    config.blog_bench_baselines = (
+        json.loads(path.read_text()) if path.exists() else {}
+    )
+    config.blog_bench_results = {}
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if os.environ.get('BLOG_BENCH_UPDATE') and config.blog_bench_results:
+        baselines = {
+            **config.blog_bench_baselines, **config.blog_bench_results
+        }
+        config.blog_bench_baseline_path.write_text(json.dumps(
+            baselines, indent=2, sort_keys=True, ensure_ascii=False
+        ) + '\n')
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.blog_bench_results
+    if not results:
+        return
+    terminalreporter.section(
+        f'blog benchmarks: {config.blog_bench_profile}'
+        f' {config.blog_bench_sizes}'
+    )
+    terminalreporter.write_line(
+        f'{"маршрут":<40} {"запросы":>8} {"p50, мс":>9} {"p95, мс":>9}'
+        f' {"байты":>9}'
+    )
+    for key, result in sorted(results.items()):
+        terminalreporter.write_line(
+            f'{key:<40} {result["queries"]:>8}'
+            f' {result["p50"] * 1000:>9.2f} {result["p95"] * 1000:>9.2f}'
+            f' {result["bytes"]:>9}'
+        )
+
+
+@pytest.fixture(autouse=True)
+def enable_debug_false():
+    with override_settings(DEBUG=False):
+        yield
+
+
+@pytest.fixture(scope='session')
+def django_db_setup(django_db_setup, django_db_blocker, request):
+    with django_db_blocker.unblock():
+        call_command(
+            'seed_blog', verbosity=0, **request.config.blog_bench_sizes
+        )
+
+
+@pytest.fixture
+def bench_runs():
+    return max(2, int(os.environ.get('BLOG_BENCH_RUNS', 20)))
+
+
+@pytest.fixture
+def bench_strict_latency():
+    return bool(os.environ.get('BLOG_BENCH_STRICT_LATENCY'))
+
+
+@pytest.fixture
+def bench_record(request, bench_strict_latency):
+    """Сохраняет результат замера и сравнивает его с базовым."""
+    config = request.config
+    tolerance = float(os.environ.get('BLOG_BENCH_LATENCY_TOLERANCE', 1.0))
+
+    def record(key, result):
+        config.blog_bench_results[key] = result
+        baseline = config.blog_bench_baselines.get(key)
+        if baseline is None or os.environ.get('BLOG_BENCH_UPDATE'):
+            return
+        assert result['status'] == baseline['status'], (
+            f'{key}: код ответа {result["status"]} вместо'
+            f' {baseline["status"]}.'
+        )
+        assert result['queries'] <= baseline['queries'], (
+            f'{key}: число запросов выросло с {baseline["queries"]}'
+            f' до {result["queries"]}.'
+        )
+        assert result['bytes'] <= baseline['bytes'] * (
+            1 + BYTES_TOLERANCE
+        ), (
+            f'{key}: размер ответа вырос с {baseline["bytes"]}'
+            f' до {result["bytes"]} байт.'
+        )
+        if not bench_strict_latency:
+            return
+        limit = baseline['p95'] * (1 + tolerance) + LATENCY_SLACK
+        assert result['p95'] <= limit, (
+            f'{key}: p95 {result["p95"] * 1000:.2f} мс превышает допустимые'
+            f' {limit * 1000:.2f} мс.'
+        )
+
+    return record
@@ -0,0 +1,52 @@
+import gc
+import statistics
+import time
+
+from django.template.loader import render_to_string
+
+from blog.constants import PER_PAGE
+from blog.pagination import FeedPaginator
+
+SIZES = (1000, 1000000)
+
+
+def _measure(n_posts, runs):
+    paginator = FeedPaginator(range(n_posts), PER_PAGE)
+    page = paginator.get_page(paginator.num_pages // 2)
+    # Прогрев: загрузка шаблона не входит в замер.
+    render_to_string('includes/paginator.html', {'page_obj': page})
+    timings = []
+    for _ in range(runs):
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            html = render_to_string(
+                'includes/paginator.html', {'page_obj': page}
+            )
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    timings.sort()
+    return {
+        'status': 200,
+        'queries': 0,
+        'bytes': len(html.encode()),
+        'p50': statistics.median(timings),
+        'p95': timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+    }
+
+
+def test_paginator_render_time_is_flat(
+    bench_runs, bench_record, bench_strict_latency
+):
+    results = {}
+    for n_posts in SIZES:
+        results[n_posts] = _measure(n_posts, bench_runs)
+        bench_record(f'template:paginator:{n_posts}', results[n_posts])
+    if not bench_strict_latency:
+        return
+    small, big = (results[n_posts] for n_posts in SIZES)
+    assert big['p50'] < small['p50'] * 5 + 0.005, (
+        'Убедитесь, что время отрисовки пагинатора не растёт с числом'
+        ' публикаций.'
+    )
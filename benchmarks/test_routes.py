@@ -0,0 +1,110 @@
+import gc
+import statistics
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, get_resolver, reverse
+
+from blog.caching import get_page_cache
+from blog.models import Comment, Post
+from blog.utils import published_filter
+
+pytestmark = [pytest.mark.django_db]
+
+User = get_user_model()
+
+# Аргументы маршрутов: имя -> (метод, функция от объектов замера).
+ROUTES = {
+    'blog:index': ('get', lambda s: {}),
+    'blog:post_detail': ('get', lambda s: {'pk': s['post'].pk}),
+    'blog:post_comments': ('get', lambda s: {'pk': s['post'].pk}),
+    'blog:create_post': ('get', lambda s: {}),
+    'blog:edit_post': ('get', lambda s: {'pk': s['post'].pk}),
+    'blog:category_posts': (
+        'get', lambda s: {'category_slug': s['post'].category.slug}
+    ),
+    'blog:profile': (
+        'get', lambda s: {'username': s['post'].author.username}
+    ),
+    'blog:edit_profile': ('get', lambda s: {}),
+    'blog:add_comment': ('post', lambda s: {'post_id': s['post'].pk}),
+    'blog:edit_comment': (
+        'get', lambda s: {'post_id': s['post'].pk, 'pk': s['comment'].pk}
+    ),
+    'blog:delete_post': ('get', lambda s: {'pk': s['post'].pk}),
+    'blog:delete_comment': (
+        'get', lambda s: {'post_id': s['post'].pk, 'pk': s['comment'].pk}
+    ),
+    'pages:about': ('get', lambda s: {}),
+    'pages:rules': ('get', lambda s: {}),
+}
+SESSIONS = ('anonymous', 'author')
+
+
+def _route_names(namespace):
+    resolver = get_resolver().namespace_dict[namespace][1]
+    return {
+        f'{namespace}:{pattern.name}' for pattern in resolver.url_patterns
+        if isinstance(pattern, URLPattern) and pattern.name
+    }
+
+
+@pytest.fixture
+def subject():
+    post = Post.objects.filter(published_filter()).select_related(
+        'author', 'category'
+    ).order_by('-comment_count', 'id').first()
+    comment = Comment.objects.create(
+        text='Комментарий автора', post=post, author=post.author
+    )
+    return {'post': post, 'comment': comment}
+
+
+def _measure(client, method, url, runs):
+    timings = []
+    for _ in range(runs):
+        # Холодный кэш: замеряем полную стоимость страницы.
+        cache.clear()
+        get_page_cache().clear()
+        # Как timeit: сборщик мусора не должен попадать в замер.
+        gc.disable()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = getattr(client, method)(
+                    url, {'text': 'Замер'} if method == 'post' else {}
+                )
+                timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return {
+        'status': response.status_code,
+        'queries': len(queries),
+        'bytes': len(response.content),
+        'p50': round(statistics.median(timings), 5),
+        'p95': round(statistics.quantiles(timings, n=20)[-1], 5),
+    }
+
+
+def test_every_route_is_benchmarked():
+    assert _route_names('blog') | _route_names('pages') == set(ROUTES), (
+        'Добавьте новые маршруты в ROUTES.'
+    )
+
+
+@pytest.mark.parametrize('session', SESSIONS)
+@pytest.mark.parametrize('name', sorted(ROUTES))
+def test_route(session, name, subject, bench_runs, bench_record):
+    client = Client()
+    if session == 'author':
+        client.force_login(subject['post'].author)
+    method, get_kwargs = ROUTES[name]
+    url = reverse(name, kwargs=get_kwargs(subject))
+    result = _measure(client, method, url, bench_runs)
+    assert result['status'] < 500
+    bench_record(f'{session}:{name}', result)
@@ -0,0 +1,103 @@
+import gc
+import statistics
+import time
+
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connection
+from django.template import Context, Engine
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from blog.models import Post
+from blog.utils import published_filter
+
+pytestmark = [pytest.mark.django_db]
+
+# Карточек за один рендер: больше, чем на странице, чтобы снизить шум.
+CARDS = 100
+LOOP = (
+    '{% load blog_tags %}{% for post in posts %}'
+    '{% TAG "includes/post_card.html" %}{% endfor %}'
+)
+
+
+@pytest.fixture
+def card_context():
+    posts = list(Post.objects.filter(published_filter()).select_related(
+        'author', 'category', 'location'
+    ).order_by('-pub_date')[:CARDS])
+    request = RequestFactory().get('/')
+    request.user = AnonymousUser()
+    return {'posts': posts, 'user': request.user, 'request': request}
+
+
+def _render(template, context):
+    # Холодный кэш фрагментов: карточки рендерятся полностью.
+    cache.clear()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        content = template.render(Context(context))
+        return time.perf_counter() - start, content
+    finally:
+        gc.enable()
+
+
+def _result(timings, content, queries):
+    timings.sort()
+    return {
+        'status': 200,
+        'queries': queries,
+        'bytes': len(content.encode()),
+        'p50': statistics.median(timings),
+        'p95': timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        'best': timings[0],
+    }
+
+
+def test_inline_include_is_cheaper_per_card(
+    card_context, bench_runs, bench_record, bench_strict_latency
+):
+    default = Engine.get_default()
+    # Как в продакшене: шаблоны include берутся из кэша загрузчика.
+    engine = Engine(
+        dirs=default.dirs, libraries=default.libraries,
+        loaders=[('django.template.loaders.cached.Loader',
+                  settings.TEMPLATE_LOADERS)],
+    )
+    cards = len(card_context['posts'])
+    assert cards, 'Нет опубликованных постов для замера.'
+    templates = {
+        tag: engine.from_string(LOOP.replace('TAG', tag))
+        for tag in ('include', 'inline_include')
+    }
+    timings = {tag: [] for tag in templates}
+    contents, queries = {}, {}
+    for tag, template in templates.items():
+        # Прогрев: компиляция вложенных шаблонов не входит в замер.
+        with CaptureQueriesContext(connection) as captured:
+            _render(template, card_context)
+        queries[tag] = len(captured)
+    # Чередуем варианты, чтобы фоновый шум делился между ними поровну.
+    for _ in range(bench_runs):
+        for tag, template in templates.items():
+            elapsed, contents[tag] = _render(template, card_context)
+            timings[tag].append(elapsed)
+    results = {
+        tag: _result(timings[tag], contents[tag], queries[tag])
+        for tag in templates
+    }
+    for tag, result in results.items():
+        bench_record(f'template:post_card:{tag}', result)
+    include, inline = results['include'], results['inline_include']
+    assert contents['inline_include'] == contents['include']
+    if not bench_strict_latency:
+        return
+    assert inline['best'] < include['best'], (
+        'Убедитесь, что развёрнутая карточка рендерится быстрее include:'
+        f' {inline["best"] / cards * 1e6:.1f} мкс против'
+        f' {include["best"] / cards * 1e6:.1f} мкс на карточку.'
+    )
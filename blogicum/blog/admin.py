@@ -1,8 +1,30 @@
 from django.contrib import admin
+from django.utils import timezone
 
-from .models import Category, Comment, Location, Post
+from .models import Category, Comment, Location, Post, Task
 
 admin.site.register(Category)
 admin.site.register(Location)
 admin.site.register(Post)
 admin.site.register(Comment)
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'attempts', 'run_at', 'finished_at')
+    list_filter = ('status', 'name')
+    readonly_fields = (
+        'name', 'payload', 'status', 'attempts', 'run_at', 'locked_at',
+        'error', 'created_at', 'finished_at',
+    )
+    actions = ('retry',)
+
+    @admin.action(description='Повторить выбранные задачи')
+    def retry(self, request, queryset):
+        queryset.exclude(status=Task.RUNNING).update(
+            status=Task.PENDING, attempts=0, run_at=timezone.now(),
+            finished_at=None,
+        )
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,121 @@
+import hashlib
+import time
+from functools import wraps
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.utils import make_template_fragment_key
+
+from .constants import PAGE_CACHE_TIMEOUT, POST_CARD_FRAGMENT
+
+INVALIDATION_BATCH_SIZE = 500
+FEED_VERSION = 'feed'
+CATALOG_VERSION = 'catalog'
+POST_VERSION = 'post:{pk}'
+COUNT_VERSION = 'counts'
+
+
+def post_card_keys(post_ids):
+    return [
+        make_template_fragment_key(POST_CARD_FRAGMENT, [post_id, is_author])
+        for post_id in post_ids
+        for is_author in (True, False)
+    ]
+
+
+def invalidate_post_cards(post_ids):
+    post_ids = iter(post_ids)
+    while True:
+        batch = list(islice(post_ids, INVALIDATION_BATCH_SIZE))
+        if not batch:
+            return
+        cache.delete_many(post_card_keys(batch))
+
+
+def get_page_cache():
+    return caches[getattr(settings, 'BLOG_PAGE_CACHE', DEFAULT_CACHE_ALIAS)]
+
+
+def _version_key(name):
+    return f'blog:version:{name}'
+
+
+def get_versions(*names):
+    page_cache = get_page_cache()
+    keys = [_version_key(name) for name in names]
+    versions = page_cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Метка времени вместо нуля: после вытеснения счётчика
+            # новые ключи страниц не совпадут со старыми.
+            page_cache.add(key, time.time_ns(), None)
+            versions[key] = page_cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_versions(*names):
+    page_cache = get_page_cache()
+    for name in names:
+        try:
+            page_cache.incr(_version_key(name))
+        except ValueError:
+            page_cache.set(_version_key(name), time.time_ns(), None)
+
+
+def invalidate_pages(post_ids=(), catalog=False):
+    names = [
+        FEED_VERSION,
+        *(POST_VERSION.format(pk=post_id) for post_id in post_ids)
+    ]
+    if catalog:
+        names.append(CATALOG_VERSION)
+    bump_versions(*names)
+
+
+def invalidate_post_counts():
+    bump_versions(COUNT_VERSION)
+
+
+def cache_anonymous_page(*version_names, scheduled=True):
+    """Кэширует GET-ответы view для анонимных пользователей.
+
+    Ключ страницы включает версии version_names (шаблоны str.format
+    от kwargs view); сигналы моделей увеличивают версии, и устаревшие
+    страницы перестают находиться. Если scheduled=True, страница живёт
+    не дольше, чем до выхода ближайшей отложенной публикации — в ленте
+    или, для view с аргументом category_slug, в этой категории.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if (request.method not in ('GET', 'HEAD')
+                    or request.user.is_authenticated):
+                return view(request, *args, **kwargs)
+            versions = get_versions(
+                *(name.format(**kwargs) for name in version_names)
+            )
+            path_hash = hashlib.md5(
+                request.get_full_path().encode()
+            ).hexdigest()
+            key = 'blog:page:{}:{}'.format(
+                '.'.join(map(str, versions)), path_hash
+            )
+            page_cache = get_page_cache()
+            response = page_cache.get(key)
+            if response is not None:
+                return response
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200 and not response.cookies:
+                timeout = PAGE_CACHE_TIMEOUT
+                if scheduled:
+                    # scheduling хранит метки в этом же кэше и импортирует
+                    # get_page_cache отсюда.
+                    from .scheduling import seconds_until_next_publication
+                    timeout = min(timeout, seconds_until_next_publication(
+                        category_slug=kwargs.get('category_slug')
+                    ) or timeout)
+                page_cache.set(key, response, timeout)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.utils import timezone
+
+from .constants import VISIBILITY_GRANULARITY
+
+
+def visibility_now(request=None):
+    """Момент, на который проверяется видимость отложенных публикаций.
+
+    Текущее время с часовым поясом, округлённое вниз до
+    VISIBILITY_GRANULARITY: в пределах шага одинаковые запросы ленты
+    совпадают побайтно. Для request значение фиксируется на весь запрос.
+    """
+    if request is not None and hasattr(request, '_visibility_now'):
+        return request._visibility_now
+    timestamp = timezone.now().timestamp()
+    now = datetime.fromtimestamp(
+        timestamp - timestamp % VISIBILITY_GRANULARITY, tz=dt_timezone.utc
+    )
+    if request is not None:
+        request._visibility_now = now
+    return now
+
+
+def visible_since(pub_date):
+    """Момент, с которого visibility_now() покажет публикацию."""
+    timestamp = pub_date.timestamp()
+    remainder = timestamp % VISIBILITY_GRANULARITY
+    if remainder:
+        timestamp += VISIBILITY_GRANULARITY - remainder
+    return datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
@@ -1 +1,48 @@
 PER_PAGE = 10
+CURSOR_PARAM = 'cursor'
+# True — лента листается только курсором «вперёд/назад», без COUNT(*).
+CURSOR_PAGINATION = False
+# Имя фрагмента {% cache %} карточки и срок его жизни: имя должно
+# совпадать с тем, что в includes/post_card.html, иначе карточки не
+# сбрасываются (см. caching.post_card_keys).
+POST_CARD_FRAGMENT = 'post_card'
+POST_CARD_TIMEOUT = 60 * 15
+PAGE_CACHE_TIMEOUT = 60 * 10
+COMMENTS_PER_PAGE = 20
+COUNT_CACHE_TIMEOUT = 60 * 60
+PAGE_RANGE_ON_EACH_SIDE = 2
+PAGE_RANGE_ON_ENDS = 1
+# Шаг (в секундах), до которого округляется «сейчас» в запросах видимости.
+VISIBILITY_GRANULARITY = 60
+# Уменьшенные копии Post.image: имя -> наибольшая сторона в пикселях.
+IMAGE_RENDITIONS = {'thumb': 640, 'detail': 1280}
+# Сколько процесс помнит описание копий: другие процессы узнают об удалении
+# файлов не раньше. Файл без ссылок удаляется не раньше, чем через
+# IMAGE_RELEASE_DELAY после последней загрузки того же содержимого.
+RENDITIONS_CACHE_TIMEOUT = 60 * 10
+IMAGE_RELEASE_DELAY = 60 * 10
+# Выдержка Post.excerpt для карточек: число слов и предельная длина.
+EXCERPT_WORDS = 10
+EXCERPT_MAX_LENGTH = 256
+# Столбцы, которые выводят шаблоны ленты, страницы публикации и профиля;
+# остальные (text, пароль автора, описание категории) в запрос не попадают.
+FEED_POST_FIELDS = (
+    'title', 'excerpt', 'pub_date', 'is_published', 'image', 'comment_count',
+    'author__username', 'category__title', 'category__slug',
+    'category__is_published', 'location__name', 'location__is_published',
+)
+DETAIL_POST_FIELDS = (
+    'title', 'text', 'pub_date', 'is_published', 'image',
+    'author__username', 'category__title', 'category__slug',
+    'category__is_published', 'location__name', 'location__is_published',
+)
+# post нужен менеджеру post.comments, чтобы связать комментарии с постом.
+COMMENT_FIELDS = ('text', 'created_at', 'post', 'author__username')
+PROFILE_USER_FIELDS = (
+    'username', 'first_name', 'last_name', 'date_joined', 'is_staff',
+)
+# Фоновые задачи: число попыток, пауза перед повтором (удваивается с каждой
+# попыткой) и срок, после которого «зависшую» задачу забирает другой воркер.
+TASK_MAX_ATTEMPTS = 5
+TASK_RETRY_DELAY = 30
+TASK_LOCK_TIMEOUT = 60 * 10
@@ -0,0 +1,64 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+from urllib.parse import quote
+
+from django.urls import get_resolver, get_script_prefix, get_urlconf, reverse
+from django.urls.resolvers import get_ns_resolver
+from django.utils.http import RFC3986_SUBDELIMS, escape_leading_slashes
+
+NAMESPACE = 'blog'
+# Как в reverse(): символы pchar из RFC 3986 не экранируются.
+SAFE_CHARS = RFC3986_SUBDELIMS + '/~:@'
+
+UrlTemplate = namedtuple('UrlTemplate', 'path params converters regex')
+
+
+@lru_cache(maxsize=None)
+def _url_templates(resolver):
+    # get_resolver() кэширует распознаватель, пока не сменится URLconf.
+    prefix, app_resolver = resolver.namespace_dict[NAMESPACE]
+    resolver = get_ns_resolver(
+        prefix, app_resolver, tuple(app_resolver.pattern.converters.items())
+    )
+    templates = {}
+    for name in app_resolver.reverse_dict:
+        if not isinstance(name, str):
+            continue
+        possibilities = resolver.reverse_dict.getlist(name)
+        if len(possibilities) != 1:
+            continue
+        variants, regex, defaults, converters = possibilities[0]
+        if len(variants) != 1 or defaults:
+            continue
+        path, params = variants[0]
+        templates[f'{NAMESPACE}:{name}'] = UrlTemplate(
+            path, tuple(params), converters, re.compile(f'^{regex}')
+        )
+    return templates
+
+
+def blog_url(name, *args):
+    """Адрес маршрута блога, как reverse(name, args=args).
+
+    Шаблоны путей готовятся один раз из blog/urls.py; если аргументы
+    не подходят к маршруту, ошибку формирует обычный reverse().
+    """
+    template = _url_templates(get_resolver(get_urlconf())).get(name)
+    if template is None or len(args) != len(template.params):
+        return reverse(name, args=args)
+    values = {}
+    for param, value in zip(template.params, args):
+        converter = template.converters.get(param)
+        try:
+            values[param] = (
+                converter.to_url(value) if converter else str(value)
+            )
+        except ValueError:
+            return reverse(name, args=args)
+    path = template.path % values
+    if not template.regex.search(path):
+        return reverse(name, args=args)
+    return escape_leading_slashes(
+        quote(get_script_prefix() + path, safe=SAFE_CHARS)
+    )
@@ -0,0 +1,66 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.core import serializers
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from blog.models import Category, Comment, Location, Post
+
+User = get_user_model()
+
+# Родительские модели раньше дочерних: импорт идёт в порядке файла.
+EXPORT_MODELS = (User, Category, Location, Post, Comment)
+CHUNK_SIZE = 2000
+
+
+class ExactJSONEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder без округления времени до миллисекунд."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def _fields(model):
+    # Группы и права пользователей сериализуются запросом на объект.
+    return [
+        field.name for field in model._meta.concrete_fields
+        if not field.primary_key
+    ]
+
+
+class Command(BaseCommand):
+    help = ('Выгружает пользователей, категории, местоположения, публикации '
+            'и комментарии в JSON Lines (формат dumpdata --format jsonl), '
+            'не загружая таблицы в память целиком.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output', '-o',
+            help='Файл для выгрузки; по умолчанию — стандартный вывод.'
+        )
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        if options['output']:
+            stream = open(options['output'], 'w', encoding='utf-8')
+        else:
+            # Сериализатор сам пишет переводы строк.
+            stream = self.stdout
+            stream.ending = ''
+        try:
+            for model in EXPORT_MODELS:
+                serializers.serialize(
+                    'jsonl',
+                    model._default_manager.order_by('pk').iterator(
+                        chunk_size=options['chunk_size']
+                    ),
+                    stream=stream,
+                    fields=_fields(model),
+                    cls=ExactJSONEncoder,
+                )
+        finally:
+            if options['output']:
+                stream.close()
@@ -0,0 +1,151 @@
+import json
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.core import serializers
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.core.serializers.base import DeserializationError
+from django.db import IntegrityError, connection, transaction
+
+from blog.caching import invalidate_pages, invalidate_post_counts
+from blog.models import Post, make_excerpt
+from blog.scheduling import forget_all
+
+BATCH_SIZE = 1000
+
+
+@contextmanager
+def _keep_dates(model):
+    """Не даёт bulk_create перезаписать поля auto_now и auto_now_add."""
+    fields = [
+        field for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False)
+        or getattr(field, 'auto_now_add', False)
+    ]
+    flags = [(field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, (auto_now, auto_now_add) in zip(fields, flags):
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = ('Загружает выгрузку export_blog (JSON Lines) пакетами '
+            'bulk_create с сохранением первичных ключей. Прогресс '
+            'записывается после каждого пакета, поэтому прерванную загрузку '
+            'можно продолжить повторным запуском.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('input', help='Файл выгрузки export_blog.')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            '--progress',
+            help='Файл прогресса; по умолчанию <input>.progress.'
+        )
+        parser.add_argument(
+            '--restart', action='store_true',
+            help='Начать с начала файла, игнорируя сохранённый прогресс.'
+        )
+
+    def handle(self, *args, **options):
+        self.progress = Path(
+            options['progress'] or f'{options["input"]}.progress'
+        )
+        if options['restart']:
+            self.progress.unlink(missing_ok=True)
+        self.models = set()
+        # Пакет сразу после сохранённой позиции мог записаться до того,
+        # как прерванный запуск успел сохранить прогресс.
+        self.replaying = self.progress.exists()
+        total = 0
+        with open(options['input'], 'rb') as stream:
+            stream.seek(self._offset())
+            batch, model = [], None
+            for line in stream:
+                if not line.strip():
+                    continue
+                start = stream.tell() - len(line)
+                try:
+                    data = json.loads(line)
+                except ValueError as error:
+                    raise CommandError(
+                        f'Некорректная строка на позиции {start}: {error}'
+                    ) from error
+                # Пакет bulk_create — только из объектов одной модели.
+                if batch and (
+                    data['model'] != model
+                    or len(batch) == options['batch_size']
+                ):
+                    total += self._save(batch, start)
+                    batch = []
+                model = data['model']
+                batch.append(data)
+            if batch:
+                total += self._save(batch, stream.tell())
+        self._finish()
+        self.progress.unlink(missing_ok=True)
+        self.stdout.write(self.style.SUCCESS(f'Загружено объектов: {total}.'))
+
+    def _offset(self):
+        if not self.progress.exists():
+            return 0
+        return json.loads(self.progress.read_text())['offset']
+
+    def _save(self, batch, offset):
+        # offset — позиция в файле сразу после сохранённого пакета.
+        try:
+            objects = [
+                deserialized.object
+                for deserialized in serializers.deserialize('python', batch)
+            ]
+        except DeserializationError as error:
+            raise CommandError(
+                f'Не удалось разобрать пакет перед позицией {offset}:'
+                f' {error}'
+            ) from error
+        model = type(objects[0])
+        if model is Post:
+            # bulk_create минует Post.save(); в старых выгрузках excerpt нет.
+            for post in objects:
+                if not post.excerpt:
+                    post.excerpt = make_excerpt(post.text)
+        # Уже загруженные pk пропускаются только в повторяемом пакете;
+        # в остальных любой конфликт, включая чужую строку с тем же pk, —
+        # ошибка.
+        manager = model._default_manager
+        if self.replaying:
+            loaded = set(manager.filter(
+                pk__in=[obj.pk for obj in objects]
+            ).values_list('pk', flat=True))
+            objects = [obj for obj in objects if obj.pk not in loaded]
+            self.replaying = False
+        try:
+            with transaction.atomic(), _keep_dates(model):
+                manager.bulk_create(objects)
+        except IntegrityError as error:
+            raise CommandError(
+                f'Пакет {model._meta.label} перед позицией {offset}'
+                f' конфликтует с данными в базе: {error}'
+            ) from error
+        self.progress.write_text(json.dumps({'offset': offset}))
+        self.models.add(model)
+        return len(objects)
+
+    def _finish(self):
+        # Явные pk не сдвигают последовательности в PostgreSQL.
+        statements = connection.ops.sequence_reset_sql(
+            no_style(), list(self.models)
+        )
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+        # bulk_create не шлёт сигналов; прерванный запуск мог не дойти
+        # до этого места, поэтому сбрасываем кэши целиком.
+        invalidate_pages(catalog=True)
+        invalidate_post_counts()
+        forget_all()
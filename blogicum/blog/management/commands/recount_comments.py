@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, F
+
+from blog.caching import (invalidate_pages, invalidate_post_cards,
+                          invalidate_post_counts)
+from blog.models import Post
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = ('Пересчитывает Post.comment_count по таблице комментариев; '
+            'с --check только сообщает о расхождениях.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Не исправлять, а завершиться с ошибкой при расхождении.'
+        )
+
+    def handle(self, *args, **options):
+        drifted = list(Post.objects.annotate(
+            actual=Count('comments')
+        ).exclude(comment_count=F('actual')).values_list(
+            'pk', 'comment_count', 'actual'
+        ))
+        total = len(drifted)
+        for pk, stored, actual in drifted:
+            if options['verbosity'] > 1:
+                self.stdout.write(f'Пост {pk}: {stored} -> {actual}')
+        if not options['check']:
+            Post.objects.bulk_update(
+                [Post(pk=pk, comment_count=actual)
+                 for pk, _, actual in drifted],
+                ['comment_count'], batch_size=BATCH_SIZE
+            )
+            if drifted:
+                # bulk_update не шлёт сигналов: карточки и страницы
+                # со старыми счётчиками сбрасываем явно.
+                pks = [pk for pk, _, _ in drifted]
+                invalidate_post_cards(pks)
+                invalidate_pages(post_ids=pks)
+                invalidate_post_counts()
+        if options['check'] and total:
+            raise CommandError(
+                f'Счётчик комментариев расходится у {total} постов.'
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'Исправлено постов: {total}.' if total
+            else 'Расхождений нет.'
+        ))
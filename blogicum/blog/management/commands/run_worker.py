@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog.tasks import run_next
+
+POLL_INTERVAL = 1.0
+
+
+class Command(BaseCommand):
+    help = ('Выполняет фоновые задачи из таблицы Task: обработку '
+            'изображений публикаций и другую отложенную работу.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Выполнить готовые задачи и завершиться.'
+        )
+        parser.add_argument(
+            '--interval', type=float, default=POLL_INTERVAL,
+            help='Пауза между опросами пустой очереди, в секундах.'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            job = run_next()
+            if job is None:
+                if options['once']:
+                    return
+                time.sleep(options['interval'])
+                continue
+            if options['verbosity'] > 1 or job.status != job.DONE:
+                self.stdout.write(
+                    f'{job} #{job.pk}, попытка {job.attempts}'
+                )
@@ -0,0 +1,204 @@
+import random
+from datetime import timedelta
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from blog.caching import invalidate_pages, invalidate_post_counts
+from blog.models import Category, Comment, Location, Post, make_excerpt
+from blog.scheduling import forget_all
+
+User = get_user_model()
+
+BATCH_SIZE = 1000
+PASSWORD = 'seed_blog'
+DRAW_CHUNK = 100000
+POST_FIELDS = (
+    'title', 'text', 'pub_date', 'is_published', 'created_at', 'author',
+    'category', 'location', 'image', 'comment_count', 'excerpt',
+)
+COMMENT_FIELDS = ('text', 'is_published', 'created_at', 'author', 'post')
+
+
+def _zipf_weights(n, skew):
+    # Кумулятивные веса: k-й объект выбирается с весом 1 / (k + 1) ** skew.
+    return list(accumulate(1 / (rank + 1) ** skew for rank in range(n)))
+
+
+def _last_ids(model, count):
+    # SQLite не возвращает pk из bulk_create: берём последние id.
+    ids = model.objects.order_by('-id').values_list('id', flat=True)
+    return sorted(ids[:count])
+
+
+def _created_ids(model, objects, batch_size):
+    model.objects.bulk_create(objects, batch_size=batch_size)
+    return _last_ids(model, len(objects))
+
+
+def _reset_caches():
+    invalidate_pages(catalog=True)
+    invalidate_post_counts()
+    forget_all()
+
+
+def _insert_rows(model, fields, rows):
+    """Вставляет кортежи значений одним executemany, минуя модели.
+
+    Для миллионов строк основное время bulk_create уходит на создание
+    объектов и подготовку каждого поля; значения здесь уже готовы для БД.
+    """
+    quote = connection.ops.quote_name
+    columns = [quote(model._meta.get_field(name).column) for name in fields]
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        quote(model._meta.db_table), ', '.join(columns),
+        ', '.join(['%s'] * len(columns))
+    )
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+
+class Command(BaseCommand):
+    help = ('Заполняет базу синтетическими пользователями, категориями, '
+            'местоположениями, публикациями и комментариями; одинаковый '
+            '--seed даёт одинаковые данные.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--locations', type=int, default=100)
+        parser.add_argument('--posts', type=int, default=10000)
+        parser.add_argument('--comments', type=int, default=100000)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--prefix', default='seed',
+            help='Префикс имён пользователей и slug категорий.'
+        )
+        parser.add_argument(
+            '--author-skew', type=float, default=1.0,
+            help='Показатель Ципфа для авторов: чем больше, тем сильнее '
+                 'публикации сосредоточены у немногих авторов.'
+        )
+        parser.add_argument(
+            '--comment-skew', type=float, default=1.0,
+            help='Показатель Ципфа для комментариев по публикациям.'
+        )
+        parser.add_argument(
+            '--scheduled', type=float, default=0.01,
+            help='Доля отложенных публикаций.'
+        )
+        parser.add_argument(
+            '--unpublished-posts', type=float, default=0.05,
+            help='Доля снятых с публикации постов.'
+        )
+        parser.add_argument(
+            '--unpublished-categories', type=float, default=0.05,
+            help='Доля снятых с публикации категорий.'
+        )
+        parser.add_argument('--days', type=int, default=365,
+                            help='Глубина ленты в днях.')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        self.options = options
+        self.rng = random.Random(options['seed'])
+        self.now = timezone.now()
+        self.db_now = connection.ops.adapt_datetimefield_value(self.now)
+        prefix = options['prefix']
+        batch_size = options['batch_size']
+        password = make_password(PASSWORD)
+        self.user_ids = _created_ids(User, [
+            User(username=f'{prefix}{i}', password=password)
+            for i in range(options['users'])
+        ], batch_size)
+        self.category_ids = _created_ids(Category, [
+            Category(
+                title=f'Категория {i}', description='Описание категории.',
+                slug=f'{prefix}-category-{i}',
+                is_published=(
+                    self.rng.random() >= options['unpublished_categories']
+                ),
+            )
+            for i in range(options['categories'])
+        ], batch_size)
+        # None — публикации без местоположения.
+        self.location_ids = _created_ids(Location, [
+            Location(name=f'Место {i}') for i in range(options['locations'])
+        ], batch_size) + [None]
+        self.author_weights = _zipf_weights(
+            len(self.user_ids), options['author_skew']
+        )
+        comment_counts = self._comment_counts()
+        for start in range(0, options['posts'], batch_size):
+            counts = comment_counts[start:start + batch_size]
+            _insert_rows(Post, POST_FIELDS, [
+                self._post(start + offset, count)
+                for offset, count in enumerate(counts)
+            ])
+            post_ids = _last_ids(Post, len(counts))
+            self._create_comments(post_ids, counts)
+        # Строки вставлены в обход сигналов: сбрасываем кэши целиком,
+        # как import_blog.
+        _reset_caches()
+        if options['verbosity']:
+            self.stdout.write(self.style.SUCCESS(
+                f'Создано: пользователей {len(self.user_ids)}, публикаций'
+                f' {options["posts"]}, комментариев {options["comments"]}.'
+            ))
+
+    def _comment_counts(self):
+        posts, comments = self.options['posts'], self.options['comments']
+        counts = [0] * posts
+        if not posts:
+            return counts
+        weights = _zipf_weights(posts, self.options['comment_skew'])
+        # Самые обсуждаемые посты разбросаны по ленте случайно.
+        order = list(range(posts))
+        self.rng.shuffle(order)
+        for start in range(0, comments, DRAW_CHUNK):
+            for rank in self.rng.choices(
+                range(posts), cum_weights=weights,
+                k=min(DRAW_CHUNK, comments - start)
+            ):
+                counts[order[rank]] += 1
+        return counts
+
+    def _post(self, i, comment_count):
+        rng = self.rng
+        if rng.random() < self.options['scheduled']:
+            pub_date = self.now + timedelta(
+                seconds=rng.randint(60, 30 * 24 * 3600)
+            )
+        else:
+            pub_date = self.now - timedelta(
+                seconds=rng.randint(0, self.options['days'] * 24 * 3600)
+            )
+        text = ' '.join(['Текст публикации.'] * rng.randint(5, 50))
+        return (
+            f'Публикация {i}',
+            text,
+            connection.ops.adapt_datetimefield_value(pub_date),
+            rng.random() >= self.options['unpublished_posts'],
+            self.db_now,
+            rng.choices(self.user_ids, cum_weights=self.author_weights)[0],
+            rng.choice(self.category_ids),
+            rng.choice(self.location_ids),
+            None,
+            comment_count,
+            make_excerpt(text),
+        )
+
+    def _create_comments(self, post_ids, counts):
+        rows = []
+        for post_id, count in zip(post_ids, counts):
+            for _ in range(count):
+                rows.append((
+                    f'Комментарий к публикации {post_id}.', True,
+                    self.db_now, self.rng.choice(self.user_ids), post_id,
+                ))
+        _insert_rows(Comment, COMMENT_FIELDS, rows)
@@ -0,0 +1,44 @@
+# Generated by Django 3.2.16 on 2026-10-18 19:54
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+BATCH_SIZE = 1000
+# Значения blog.constants на момент миграции.
+EXCERPT_WORDS = 10
+EXCERPT_MAX_LENGTH = 256
+
+
+def make_excerpt(text):
+    return Truncator(
+        Truncator(text).words(EXCERPT_WORDS, truncate=' …')
+    ).chars(EXCERPT_MAX_LENGTH)
+
+
+def fill_excerpt(apps, schema_editor):
+    # Исторической модели недоступен Post.save(): считаем выдержку сами.
+    Post = apps.get_model('blog', 'Post')
+    batch = []
+    for post in Post.objects.only('text').iterator(chunk_size=BATCH_SIZE):
+        post.excerpt = make_excerpt(post.text)
+        batch.append(post)
+        if len(batch) == BATCH_SIZE:
+            Post.objects.bulk_update(batch, ['excerpt'])
+            batch = []
+    Post.objects.bulk_update(batch, ['excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_task'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=256, verbose_name='Выдержка'),
+        ),
+        migrations.RunPython(fill_excerpt, migrations.RunPython.noop),
+    ]
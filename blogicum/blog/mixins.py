@@ -4,8 +4,11 @@ from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse_lazy
 from django.views import View
 
+from .constants import CURSOR_PARAM
 from .forms import PostForm
 from .models import Comment, Post
+from .pagination import CursorPaginator
+from .utils import is_cursor_request
 
 
 class PostMixin:
@@ -14,18 +17,39 @@ class PostMixin:
     template_name = 'blog/create.html'
 
 
-class AuthorizationMixin(LoginRequiredMixin, View):
+class CursorPaginationMixin:
+    def paginate_queryset(self, queryset, page_size):
+        if not is_cursor_request(self.request):
+            return super().paginate_queryset(queryset, page_size)
+        paginator = CursorPaginator(queryset, page_size)
+        page = paginator.get_page(self.request.GET.get(CURSOR_PARAM))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class CheckedObjectMixin:
+    """Отдаёт get_object() объект, уже загруженный в dispatch()."""
+
+    checked_object = None
+
+    def get_object(self, queryset=None):
+        if self.checked_object is not None:
+            return self.checked_object
+        return super().get_object(queryset)
+
+
+class AuthorizationMixin(CheckedObjectMixin, LoginRequiredMixin, View):
     def dispatch(self, request, *args, **kwargs):
         post = get_object_or_404(
-            Post,
+            Post.objects.select_related('category', 'location'),
             pk=kwargs['pk']
         )
-        if (request.user != post.author):
+        if (request.user.pk != post.author_id):
             return redirect('blog:post_detail', pk=post.pk)
+        self.checked_object = post
         return super().dispatch(request, *args, **kwargs)
 
 
-class CommentMixin(LoginRequiredMixin, View):
+class CommentMixin(CheckedObjectMixin, LoginRequiredMixin, View):
     model = Comment
     template_name = 'blog/comment.html'
 
@@ -34,8 +58,9 @@ class CommentMixin(LoginRequiredMixin, View):
             Comment,
             pk=kwargs['pk']
         )
-        if comment.author != request.user:
+        if comment.author_id != request.user.pk:
             raise PermissionDenied
+        self.checked_object = comment
         return super().dispatch(request, *args, **kwargs)
 
     def get_success_url(self):
@@ -1,10 +1,21 @@
 from core.models import BaseModel
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils.text import Truncator
+
+from .constants import EXCERPT_MAX_LENGTH, EXCERPT_WORDS
+from .links import blog_url
 
 User = get_user_model()
 
 
+def make_excerpt(text):
+    """Начало текста для карточки, как фильтр truncatewords."""
+    return Truncator(
+        Truncator(text).words(EXCERPT_WORDS, truncate=' …')
+    ).chars(EXCERPT_MAX_LENGTH)
+
+
 class Post(BaseModel):
     title = models.CharField(max_length=256, verbose_name='Заголовок')
     text = models.TextField(verbose_name='Текст')
@@ -25,15 +36,49 @@ class Post(BaseModel):
                                  related_name='posts')
     image = models.ImageField('Изображение', upload_to='posts_images',
                               null=True, blank=True)
+    comment_count = models.PositiveIntegerField(
+        'Количество комментариев', default=0, editable=False
+    )
+    excerpt = models.CharField(
+        'Выдержка', max_length=EXCERPT_MAX_LENGTH, blank=True, editable=False
+    )
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date',)
+        indexes = (
+            models.Index(
+                fields=('-pub_date', '-id'),
+                condition=models.Q(is_published=True),
+                name='post_feed_idx',
+            ),
+            models.Index(
+                fields=('category', '-pub_date', '-id'),
+                condition=models.Q(is_published=True),
+                name='post_category_feed_idx',
+            ),
+            models.Index(
+                fields=('author', '-pub_date', '-id'),
+                name='post_author_feed_idx',
+            ),
+        )
 
     def __str__(self):
         return self.title
 
+    def get_absolute_url(self):
+        return blog_url('blog:post_detail', self.pk)
+
+    def save(self, *args, **kwargs):
+        # Текст не загружен (defer) — значит, он и не менялся.
+        if 'text' in self.__dict__:
+            self.excerpt = make_excerpt(self.text)
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'text' in update_fields:
+                kwargs['update_fields'] = {*update_fields, 'excerpt'}
+        super().save(*args, **kwargs)
+
 
 class Category(BaseModel):
     title = models.CharField(max_length=256, verbose_name='Заголовок')
@@ -52,6 +97,9 @@ class Category(BaseModel):
     def __str__(self):
         return self.title
 
+    def get_absolute_url(self):
+        return blog_url('blog:category_posts', self.slug)
+
 
 class Location(BaseModel):
     name = models.CharField(max_length=256, verbose_name='Название места')
@@ -86,3 +134,40 @@ class Comment(BaseModel):
 
     def __str__(self):
         return self.text[:100]
+
+
+class Task(models.Model):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUSES = (
+        (PENDING, 'В очереди'),
+        (RUNNING, 'Выполняется'),
+        (DONE, 'Выполнена'),
+        (FAILED, 'Ошибка'),
+    )
+
+    name = models.CharField('Задача', max_length=64)
+    payload = models.JSONField('Аргументы', default=dict)
+    status = models.CharField('Статус', max_length=16, choices=STATUSES,
+                              default=PENDING)
+    attempts = models.PositiveSmallIntegerField('Попыток', default=0)
+    run_at = models.DateTimeField('Запустить не раньше', db_index=True)
+    locked_at = models.DateTimeField('Взята в работу', null=True,
+                                     blank=True)
+    error = models.TextField('Последняя ошибка', blank=True)
+    created_at = models.DateTimeField('Добавлено', auto_now_add=True)
+    finished_at = models.DateTimeField('Завершена', null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'фоновая задача'
+        verbose_name_plural = 'Фоновые задачи'
+        ordering = ('-created_at',)
+        indexes = (
+            models.Index(fields=('status', 'run_at'),
+                         name='task_queue_idx'),
+        )
+
+    def __str__(self):
+        return f'{self.name} ({self.get_status_display()})'
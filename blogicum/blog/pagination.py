@@ -0,0 +1,188 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Page, Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from .caching import COUNT_VERSION, get_page_cache, get_versions
+from .constants import (COUNT_CACHE_TIMEOUT, PAGE_RANGE_ON_EACH_SIDE,
+                        PAGE_RANGE_ON_ENDS)
+from .scheduling import seconds_until_next_publication
+
+NEXT = 'next'
+PREVIOUS = 'prev'
+
+
+class CursorPage(Sequence):
+    """Страница курсорной пагинации: только переходы «вперёд/назад»."""
+
+    is_cursor_page = True
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return '<Cursor page of %s objects>' % len(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    def next_cursor(self):
+        if not (self._has_next and self.object_list):
+            return None
+        return self.paginator.encode_cursor(NEXT, self.object_list[-1])
+
+    def previous_cursor(self):
+        if not (self._has_previous and self.object_list):
+            return None
+        return self.paginator.encode_cursor(PREVIOUS, self.object_list[0])
+
+
+class CursorPaginator:
+    """Keyset-пагинация по полям сортировки без COUNT(*) и OFFSET.
+
+    Курсор — непрозрачный токен с направлением и значениями полей
+    сортировки граничной записи; следующая страница выбирается условием
+    «строго после этой записи», поэтому глубокие страницы стоят столько же,
+    сколько первая. Последнее поле сортировки должно быть уникальным.
+    """
+
+    def __init__(self, object_list, per_page, ordering=('-pub_date', '-id')):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+
+    @cached_property
+    def _fields(self):
+        return tuple(
+            (name.lstrip('-'), name.startswith('-'))
+            for name in self.ordering
+        )
+
+    def encode_cursor(self, direction, obj):
+        values = [
+            self.object_list.model._meta.get_field(name).value_to_string(obj)
+            for name, _ in self._fields
+        ]
+        raw = json.dumps([direction, values], separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """Вернуть (направление, значения); битый курсор — первая страница."""
+        if not cursor:
+            return NEXT, None
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            direction, values = json.loads(raw)
+            if (direction not in (NEXT, PREVIOUS)
+                    or len(values) != len(self._fields)):
+                raise ValueError
+            opts = self.object_list.model._meta
+            values = [
+                opts.get_field(name).to_python(value)
+                for (name, _), value in zip(self._fields, values)
+            ]
+        except (binascii.Error, TypeError, ValueError, ValidationError):
+            return NEXT, None
+        return direction, values
+
+    def _seek(self, values, backwards):
+        condition = Q()
+        equal = {}
+        for (name, descending), value in zip(self._fields, values):
+            lookup = 'lt' if descending != backwards else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+        return condition
+
+    def _order(self, backwards):
+        if not backwards:
+            return self.ordering
+        return tuple(
+            name if descending else f'-{name}'
+            for name, descending in self._fields
+        )
+
+    def get_page(self, cursor):
+        direction, values = self.decode_cursor(cursor)
+        backwards = direction == PREVIOUS
+        queryset = self.object_list
+        if values is not None:
+            queryset = queryset.filter(self._seek(values, backwards))
+        rows = list(
+            queryset.order_by(*self._order(backwards))[:self.per_page + 1]
+        )
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+            return CursorPage(rows, self, has_next=True,
+                              has_previous=has_more)
+        return CursorPage(rows, self, has_next=has_more,
+                          has_previous=values is not None)
+
+
+class FeedPage(Page):
+    @cached_property
+    def elided_page_range(self):
+        """Первые, последние и соседние с текущей страницы, между ними «…»."""
+        return list(self.paginator.get_elided_page_range(
+            self.number,
+            on_each_side=PAGE_RANGE_ON_EACH_SIDE,
+            on_ends=PAGE_RANGE_ON_ENDS
+        ))
+
+
+class FeedPaginator(Paginator):
+    def _get_page(self, *args, **kwargs):
+        return FeedPage(*args, **kwargs)
+
+
+class CachedCountPaginator(FeedPaginator):
+    """Paginator, берущий COUNT(*) из кэша по сигнатуре выборки.
+
+    count_key описывает фильтр выборки («feed», «category:<slug>»...);
+    запись сбрасывается при изменении постов и категорий и живёт не
+    дольше, чем до выхода ближайшей отложенной публикации в scope.
+    """
+
+    def __init__(self, object_list, per_page, count_key,
+                 schedule_scope=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_key = count_key
+        self.schedule_scope = schedule_scope
+
+    @cached_property
+    def count(self):
+        version, = get_versions(COUNT_VERSION)
+        key = f'blog:count:{version}:{self.count_key}'
+        count_cache = get_page_cache()
+        count = count_cache.get(key)
+        if count is None:
+            count = self.object_list.count()
+            timeout = COUNT_CACHE_TIMEOUT
+            if self.schedule_scope is not None:
+                timeout = min(timeout, seconds_until_next_publication(
+                    **self.schedule_scope
+                ) or timeout)
+            count_cache.set(key, count, timeout)
+        return count
@@ -0,0 +1,175 @@
+import os
+from datetime import timedelta
+from io import BytesIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from PIL import Image
+
+from .caching import invalidate_pages, invalidate_post_cards
+from .constants import (IMAGE_RELEASE_DELAY, IMAGE_RENDITIONS,
+                        RENDITIONS_CACHE_TIMEOUT, TASK_LOCK_TIMEOUT)
+from .models import Post
+from .tasks import enqueue, is_queued, schedule, task
+
+# Форматы, которые копия сохраняет; остальные (GIF и др.) — в PNG.
+KEPT_FORMATS = {'JPEG': '.jpg', 'PNG': '.png'}
+WEBP = ('WEBP', '.webp')
+
+
+def _cache_key(name):
+    return f'blog:renditions:{name}'
+
+
+def _queued_key(name):
+    return f'blog:renditions:queued:{name}'
+
+
+def rendition_name(name, size, ext):
+    """Имя копии рядом с оригиналом: photo.jpg -> photo.thumb.webp."""
+    return f'{os.path.splitext(name)[0]}.{size}{ext}'
+
+
+def _encode(image, image_format):
+    if image_format == 'JPEG' and image.mode != 'RGB':
+        image = image.convert('RGB')
+    buffer = BytesIO()
+    image.save(buffer, image_format, optimize=True, quality=85)
+    return buffer.getvalue()
+
+
+def _describe(storage, names):
+    with storage.open(names[0]) as file, Image.open(file) as image:
+        width, height = image.size
+    return {
+        'url': storage.url(names[0]), 'webp': storage.url(names[1]),
+        'width': width, 'height': height,
+    }
+
+
+def _find_renditions(image):
+    # Копии, созданные другим процессом, ищем в хранилище.
+    storage = image.storage
+    renditions = {}
+    for size in IMAGE_RENDITIONS:
+        names = [
+            rendition_name(image.name, size, ext)
+            for ext in (*KEPT_FORMATS.values(), WEBP[1])
+        ]
+        found = [name for name in names if storage.exists(name)]
+        if len(found) != 2 or found[-1] != names[-1]:
+            return None
+        renditions[size] = _describe(storage, found)
+    return renditions
+
+
+def _save(storage, name, image, image_format):
+    if not storage.exists(name):
+        # Копия живёт под именем, выведенным из оригинала: иначе её не
+        # найдут ни _find_renditions(), ни release_image().
+        save = getattr(storage, 'save_derived', storage.save)
+        name = save(name, ContentFile(_encode(image, image_format)))
+    return storage.url(name)
+
+
+def build_renditions(image):
+    """Создаёт недостающие копии изображения и описывает их.
+
+    Для каждого размера из IMAGE_RENDITIONS сохраняются копия в формате
+    оригинала и WebP; результат кэшируется по имени файла.
+    """
+    storage = image.storage
+    with image.open('rb'), Image.open(image) as original:
+        original.load()
+    kept = original.format if original.format in KEPT_FORMATS else 'PNG'
+    formats = ((kept, KEPT_FORMATS[kept]), WEBP)
+    renditions = {}
+    for size, side in IMAGE_RENDITIONS.items():
+        copy = original.copy()
+        copy.thumbnail((side, side))
+        urls = [
+            _save(storage, rendition_name(image.name, size, ext), copy,
+                  image_format)
+            for image_format, ext in formats
+        ]
+        renditions[size] = {
+            'url': urls[0], 'webp': urls[1],
+            'width': copy.width, 'height': copy.height,
+        }
+    cache.set(_cache_key(image.name), renditions, RENDITIONS_CACHE_TIMEOUT)
+    return renditions
+
+
+def get_renditions(image):
+    """Описание готовых копий изображения; None — копий пока нет."""
+    if not image:
+        return None
+    renditions = cache.get(_cache_key(image.name))
+    if renditions is None:
+        try:
+            renditions = _find_renditions(image)
+        except (OSError, ValueError):
+            return None
+        if renditions is not None:
+            cache.set(
+                _cache_key(image.name), renditions, RENDITIONS_CACHE_TIMEOUT
+            )
+    return renditions
+
+
+def forget_renditions(name):
+    """Забывает описание копий в этом процессе: файл мог быть удалён."""
+    cache.delete(_cache_key(name))
+
+
+def queue_renditions(post):
+    """Ставит создание копий в очередь, если их ещё нет."""
+    if not post.image or get_renditions(post.image) is not None:
+        return
+    if not cache.add(_queued_key(post.image.name), True, TASK_LOCK_TIMEOUT):
+        return
+    # Отметка в кэше снимается и после неудачной попытки, а задача ждёт
+    # повтора: вторая задача для того же поста не нужна.
+    if not is_queued(build_post_renditions, post_id=post.pk):
+        enqueue(build_post_renditions, post_id=post.pk)
+
+
+@task
+def build_post_renditions(post_id):
+    post = Post.objects.filter(pk=post_id).first()
+    if post is None or not post.image:
+        return
+    try:
+        build_renditions(post.image)
+    finally:
+        cache.delete(_queued_key(post.image.name))
+    # Карточка и страницы до этого показывали оригинал.
+    invalidate_post_cards([post_id])
+    invalidate_pages(post_ids=[post_id])
+
+
+@task
+def release_image(name):
+    """Удаляет файл и его копии, если на него больше не ссылаются посты.
+
+    Одинаковые загрузки хранятся одним файлом, поэтому счётчиком ссылок
+    служит число постов с этим именем. Недавно загруженный повторно файл
+    может принадлежать посту, который ещё не сохранён: его удаление
+    откладывается на IMAGE_RELEASE_DELAY.
+    """
+    if Post.objects.filter(image=name).exists():
+        return
+    storage = Post._meta.get_field('image').storage
+    if storage.exists(name):
+        release_at = storage.get_modified_time(name) + timedelta(
+            seconds=IMAGE_RELEASE_DELAY
+        )
+        if release_at > timezone.now():
+            schedule(release_image, release_at, name=name)
+            return
+    storage.delete(name)
+    for size in IMAGE_RENDITIONS:
+        for ext in (*KEPT_FORMATS.values(), WEBP[1]):
+            storage.delete(rendition_name(name, size, ext))
+    forget_renditions(name)
@@ -0,0 +1,85 @@
+from django.db.models import Min
+from django.utils import timezone
+
+from .caching import get_page_cache
+from .clock import visibility_now, visible_since
+from .constants import PAGE_CACHE_TIMEOUT
+from .models import Category, Post
+
+NOTHING_SCHEDULED = 'nothing'
+
+
+def _scope_key(scope):
+    return f'blog:next_publication:{scope}'
+
+
+def _scope(category_slug=None, author_id=None):
+    if category_slug is not None:
+        return f'category:{category_slug}', {'category__slug': category_slug}
+    if author_id is not None:
+        return f'author:{author_id}', {'author_id': author_id}
+    return 'all', {}
+
+
+def next_publication(category_slug=None, author_id=None):
+    """Момент, когда станет видна ближайшая отложенная публикация.
+
+    Считается для всей ленты, категории или автора и хранится в кэше
+    страниц (общем с числом записей) до этого момента либо до изменения
+    постов и категорий; None — отложенных публикаций нет. Отсутствие
+    отложенных публикаций помнится не дольше PAGE_CACHE_TIMEOUT.
+    """
+    scope, filters = _scope(category_slug, author_id)
+    cache = get_page_cache()
+    moment = cache.get(_scope_key(scope))
+    if moment == NOTHING_SCHEDULED:
+        return None
+    if moment is not None and moment > timezone.now():
+        return moment
+    pub_date = Post.objects.filter(
+        is_published=True,
+        category__is_published=True,
+        pub_date__gt=visibility_now(),
+        **filters
+    ).aggregate(Min('pub_date'))['pub_date__min']
+    if pub_date is None:
+        cache.set(_scope_key(scope), NOTHING_SCHEDULED, PAGE_CACHE_TIMEOUT)
+        return None
+    moment = visible_since(pub_date)
+    cache.set(_scope_key(scope), moment, _seconds_until(moment))
+    return moment
+
+
+def _seconds_until(moment):
+    return max(1, int((moment - timezone.now()).total_seconds()) + 1)
+
+
+def seconds_until_next_publication(category_slug=None, author_id=None):
+    moment = next_publication(category_slug, author_id)
+    if moment is None:
+        return None
+    return _seconds_until(moment)
+
+
+def forget_post(post):
+    keys = [_scope_key('all'), _scope_key(f'author:{post.author_id}')]
+    if post.category_id is not None:
+        keys.append(_scope_key(f'category:{post.category.slug}'))
+    get_page_cache().delete_many(keys)
+
+
+def forget_category(category):
+    author_ids = category.posts.values_list(
+        'author_id', flat=True
+    ).order_by().distinct()
+    get_page_cache().delete_many([
+        _scope_key('all'),
+        _scope_key(f'category:{category.slug}'),
+        *(_scope_key(f'author:{author_id}') for author_id in author_ids),
+    ])
+
+
+def forget_all():
+    """Забывает ближайшие публикации всех лент: после записей без сигналов."""
+    for category in Category.objects.all():
+        forget_category(category)
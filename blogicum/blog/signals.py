@@ -0,0 +1,107 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.db.models.signals import (post_delete, post_init, post_save,
+                                      pre_delete)
+from django.dispatch import receiver
+
+from .caching import (invalidate_pages, invalidate_post_cards,
+                      invalidate_post_counts)
+from .models import Category, Comment, Location, Post
+from .renditions import forget_renditions, queue_renditions, release_image
+from .scheduling import forget_category, forget_post
+from .tasks import enqueue
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, **kwargs):
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1
+    )
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_commented_post(sender, instance, **kwargs):
+    invalidate_post_cards([instance.post_id])
+    invalidate_pages(post_ids=[instance.post_id])
+
+
+@receiver(post_init, sender=Post)
+def remember_image(sender, instance, **kwargs):
+    # Из базы приходит строка; новый File ещё не сохранён и не в счёт.
+    # Через __dict__: отложенное (defer) поле не должно грузиться запросом.
+    image = instance.__dict__.get('image')
+    instance._stored_image = image if isinstance(image, str) else None
+
+
+@receiver(post_save, sender=Post)
+def release_replaced_image(sender, instance, **kwargs):
+    stored = getattr(instance, '_stored_image', None)
+    if stored and stored != instance.image.name:
+        enqueue(release_image, name=stored)
+    if instance.image and instance.image.name != stored:
+        # Тот же файл мог быть удалён и загружен снова: описание копий,
+        # запомненное до удаления, устарело.
+        forget_renditions(instance.image.name)
+    instance._stored_image = instance.image.name
+
+
+@receiver(post_delete, sender=Post)
+def release_deleted_image(sender, instance, **kwargs):
+    if instance.image:
+        enqueue(release_image, name=instance.image.name)
+
+
+@receiver(post_save, sender=Post)
+def queue_post_renditions(sender, instance, **kwargs):
+    # Копии готовит воркер: ответ на загрузку не ждёт Pillow.
+    queue_renditions(instance)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post(sender, instance, **kwargs):
+    invalidate_post_cards([instance.pk])
+    invalidate_pages(post_ids=[instance.pk])
+    invalidate_post_counts()
+    forget_post(instance)
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def invalidate_category_posts(sender, instance, **kwargs):
+    invalidate_post_counts()
+    forget_category(instance)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(pre_delete, sender=Category)
+@receiver(pre_delete, sender=Location)
+def invalidate_related_posts(sender, instance, **kwargs):
+    if not kwargs.get('created'):
+        invalidate_post_cards(
+            instance.posts.values_list('pk', flat=True).iterator()
+        )
+        invalidate_pages(catalog=True)
+
+
+@receiver(post_save, sender=User)
+def invalidate_author_posts(sender, instance, created, update_fields,
+                            **kwargs):
+    if created or (update_fields and 'username' not in update_fields):
+        return
+    invalidate_post_cards(
+        instance.posts.values_list('pk', flat=True).iterator()
+    )
+    invalidate_pages(catalog=True)
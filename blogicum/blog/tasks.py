@@ -0,0 +1,89 @@
+import traceback
+from datetime import timedelta
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .constants import TASK_LOCK_TIMEOUT, TASK_MAX_ATTEMPTS, TASK_RETRY_DELAY
+from .models import Task
+
+TASKS = {}
+
+
+def task(func):
+    """Регистрирует функцию как фоновую задачу с именем функции."""
+    TASKS[func.__name__] = func
+    return func
+
+
+def enqueue(func, **payload):
+    """Ставит задачу в очередь; аргументы должны сериализоваться в JSON."""
+    return schedule(func, timezone.now(), **payload)
+
+
+def schedule(func, run_at, **payload):
+    """Ставит задачу в очередь с запуском не раньше run_at."""
+    return Task.objects.create(
+        name=func.__name__, payload=payload, run_at=run_at
+    )
+
+
+def is_queued(func, **payload):
+    """Есть ли незавершённая задача func с теми же аргументами."""
+    return Task.objects.filter(
+        name=func.__name__, payload=payload,
+        status__in=(Task.PENDING, Task.RUNNING),
+    ).exists()
+
+
+def _candidates(now, limit=10):
+    # locked_at входит в снимок: зависшая задача остаётся RUNNING, и только
+    # по нему видно, что её уже забрал другой воркер.
+    return list(Task.objects.filter(
+        Q(status=Task.PENDING, run_at__lte=now)
+        | Q(status=Task.RUNNING,
+            locked_at__lt=now - timedelta(seconds=TASK_LOCK_TIMEOUT))
+    ).order_by('run_at', 'pk').values('pk', 'status', 'locked_at')[:limit])
+
+
+def _take(candidate, now):
+    # Атомарный UPDATE по снимку строки: из конкурирующих воркеров задачу
+    # получит только один, и SELECT ... FOR UPDATE не нужен.
+    return bool(Task.objects.filter(**candidate).update(
+        status=Task.RUNNING, locked_at=now, attempts=F('attempts') + 1
+    ))
+
+
+def _claim():
+    now = timezone.now()
+    for candidate in _candidates(now):
+        if _take(candidate, now):
+            return Task.objects.get(pk=candidate['pk'])
+    return None
+
+
+def run_next():
+    """Выполняет одну готовую задачу; None — очередь пуста."""
+    job = _claim()
+    if job is None:
+        return None
+    try:
+        TASKS[job.name](**job.payload)
+    except Exception:
+        job.error = traceback.format_exc()
+        if job.attempts < TASK_MAX_ATTEMPTS:
+            job.status = Task.PENDING
+            job.run_at = timezone.now() + timedelta(
+                seconds=TASK_RETRY_DELAY * 2 ** (job.attempts - 1)
+            )
+        else:
+            job.status = Task.FAILED
+            job.finished_at = timezone.now()
+    else:
+        job.status = Task.DONE
+        job.finished_at = timezone.now()
+    job.locked_at = None
+    job.save(update_fields=(
+        'status', 'run_at', 'locked_at', 'error', 'finished_at'
+    ))
+    return job
@@ -0,0 +1,127 @@
+from django import template
+from django.template import Engine, Node, NodeList, Template
+from django.template.defaulttags import IfNode
+from django.template.loader_tags import ExtendsNode, IncludeNode
+
+from blog.constants import POST_CARD_TIMEOUT
+from blog.links import blog_url
+from blog.renditions import get_renditions, queue_renditions
+
+register = template.Library()
+
+IMAGE_SIZES = '(max-width: 40rem) 100vw, 40rem'
+
+
+def _srcset(renditions, key):
+    # Маленький оригинал даёт копии одной ширины: дубли srcset не нужны.
+    widths = {}
+    for rendition in renditions.values():
+        widths.setdefault(rendition['width'], rendition[key])
+    return ', '.join(f'{url} {width}w' for width, url in widths.items())
+
+
+@register.filter
+def is_author(user, post):
+    return user.is_authenticated and user.pk == post.author_id
+
+
+register.simple_tag(blog_url)
+
+
+@register.simple_tag
+def post_card_timeout():
+    return POST_CARD_TIMEOUT
+
+
+@register.inclusion_tag('includes/post_image.html')
+def post_image(post, size):
+    renditions = get_renditions(post.image)
+    if renditions is None:
+        # Пока воркер готовит копии, показываем оригинал.
+        queue_renditions(post)
+    context = {'image': post.image, 'renditions': renditions}
+    if renditions:
+        context.update(
+            rendition=renditions[size],
+            srcset=_srcset(renditions, 'url'),
+            webp_srcset=_srcset(renditions, 'webp'),
+            sizes=IMAGE_SIZES,
+        )
+    return context
+
+
+class InlineIncludeNode(Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        return self.nodelist.render(context)
+
+
+def _constant_include(node):
+    """Имя шаблона {% include "..." %} без with/only, иначе None."""
+    if (
+        not isinstance(node, IncludeNode) or node.extra_context
+        or node.isolated_context or node.template.filters
+    ):
+        return None
+    name = node.template.var
+    if isinstance(name, str) and not name.startswith('.'):
+        return name
+    return None
+
+
+def _flatten(nodelist, engine, seen):
+    flat = NodeList()
+    for node in nodelist:
+        name = _constant_include(node)
+        if name is not None:
+            flat.extend(_compile_inline(name, engine, seen))
+            continue
+        if isinstance(node, IfNode):
+            node.conditions_nodelists = [
+                (condition, _flatten(branch, engine, seen))
+                for condition, branch in node.conditions_nodelists
+            ]
+        else:
+            for attr in node.child_nodelists:
+                branch = getattr(node, attr, None)
+                if branch:
+                    setattr(node, attr, _flatten(branch, engine, seen))
+        flat.append(node)
+    return flat
+
+
+def _compile_inline(name, engine, seen):
+    if name in seen:
+        raise template.TemplateSyntaxError(
+            f'inline_include: шаблон {name} включает сам себя.'
+        )
+    origin = engine.find_template(name)[1]
+    # Свежая компиляция: узлы шаблона из кэша загрузчика не трогаем.
+    compiled = Template(
+        origin.loader.get_contents(origin), origin, name, engine
+    )
+    if any(isinstance(node, ExtendsNode) for node in compiled.nodelist):
+        raise template.TemplateSyntaxError(
+            f'inline_include: шаблон {name} использует extends.'
+        )
+    return _flatten(compiled.nodelist, engine, seen | {name})
+
+
+@register.tag
+def inline_include(parser, token):
+    """{% include "имя" %}, развёрнутый в узлы при компиляции шаблона.
+
+    Вложенные include с постоянным именем разворачиваются тоже, так что
+    тело цикла ленты рендерится одним списком узлов — без поиска шаблона
+    и нового состояния render_context на каждую карточку.
+    """
+    bits = token.split_contents()
+    if len(bits) != 2 or bits[1][:1] not in ('"', "'"):
+        raise template.TemplateSyntaxError(
+            'inline_include принимает одно имя шаблона в кавычках.'
+        )
+    loader = parser.origin.loader if parser.origin else None
+    engine = loader.engine if loader else Engine.get_default()
+    return InlineIncludeNode(_compile_inline(bits[1][1:-1], engine, set()))
@@ -1,6 +1,4 @@
 from django.urls import path
-from django.conf import settings
-from django.conf.urls.static import static
 
 from . import views
 
@@ -10,6 +8,8 @@ app_name = 'blog'
 urlpatterns = [
     path('', views.index, name='index'),
     path('posts/<int:pk>/', views.post_detail, name='post_detail'),
+    path('posts/<int:pk>/comments/', views.post_comments,
+         name='post_comments'),
     path('posts/create/', views.PostCreateView.as_view(), name='create_post'),
     path('posts/<int:pk>/edit/', views.PostUpdateView.as_view(),
          name='edit_post'),
@@ -27,4 +27,4 @@ urlpatterns = [
          name='delete_post'),
     path('posts/<int:post_id>/delete_comment/<int:pk>/',
          views.CommentDeleteView.as_view(), name='delete_comment')
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+]
@@ -1,21 +1,70 @@
-from datetime import datetime
+from django.db.models import Q
+from django.shortcuts import get_object_or_404
 
-from django.core.paginator import Paginator
-from django.db.models import Count
-
-from .constants import PER_PAGE
+from .clock import visibility_now
+from .constants import (COMMENT_FIELDS, COMMENTS_PER_PAGE, CURSOR_PAGINATION,
+                        CURSOR_PARAM, DETAIL_POST_FIELDS, FEED_POST_FIELDS,
+                        PER_PAGE)
 from .models import Post
+from .pagination import CachedCountPaginator, CursorPaginator, FeedPaginator
 
 
-def get_posts(post_objects=Post.objects):
-    return post_objects.select_related(
-        'category', 'location', 'author'
-    ).filter(
+def published_filter(now=None):
+    return Q(
         is_published=True,
         category__is_published=True,
-        pub_date__lte=datetime.now()
-    ).order_by('-pub_date').annotate(comment_count=Count('comments'))
+        pub_date__lte=now or visibility_now()
+    )
+
+
+def get_posts(post_objects=Post.objects, published_only=True, now=None):
+    posts = post_objects.select_related(
+        'category', 'location', 'author'
+    ).only(*FEED_POST_FIELDS)
+    if published_only:
+        posts = posts.filter(published_filter(now))
+    return posts.order_by('-pub_date', '-id')
+
+
+def get_visible_post(request, pk):
+    visible = published_filter(visibility_now(request))
+    if request.user.is_authenticated:
+        visible |= Q(author=request.user)
+    return get_object_or_404(
+        Post.objects.select_related(
+            'category', 'location', 'author'
+        ).only(*DETAIL_POST_FIELDS),
+        visible,
+        pk=pk
+    )
+
+
+def is_cursor_request(request):
+    return CURSOR_PAGINATION or CURSOR_PARAM in request.GET
+
+
+def get_page_obj(object_list, request, count_key=None, schedule_scope=None):
+    """Страница выборки по параметрам запроса.
+
+    Без count_key число записей считается COUNT(*) на каждый запрос,
+    с ним — берётся из кэша (см. CachedCountPaginator).
+    """
+    if is_cursor_request(request):
+        return CursorPaginator(object_list, PER_PAGE).get_page(
+            request.GET.get(CURSOR_PARAM)
+        )
+    if count_key is None:
+        paginator = FeedPaginator(object_list, PER_PAGE)
+    else:
+        paginator = CachedCountPaginator(
+            object_list, PER_PAGE, count_key, schedule_scope
+        )
+    return paginator.get_page(request.GET.get('page'))
 
 
-def get_page_obj(object_list, page_number):
-    return Paginator(object_list, PER_PAGE).get_page(page_number)
+def get_comments_page(post, cursor=None):
+    return CursorPaginator(
+        post.comments.select_related('author').only(*COMMENT_FIELDS),
+        COMMENTS_PER_PAGE,
+        ordering=('created_at', 'id')
+    ).get_page(cursor)
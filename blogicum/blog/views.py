@@ -3,45 +3,60 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse_lazy
+from django.utils.functional import cached_property
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
-from .constants import PER_PAGE
+from .caching import (CATALOG_VERSION, FEED_VERSION, POST_VERSION,
+                      cache_anonymous_page)
+from .clock import visibility_now
+from .constants import CURSOR_PARAM, PER_PAGE, PROFILE_USER_FIELDS
 from .forms import CommentForm
-from .mixins import AuthorizationMixin, CommentMixin, PostMixin
+from .mixins import (AuthorizationMixin, CommentMixin, CursorPaginationMixin,
+                     PostMixin)
 from .models import Category, Comment, Post
-from .utils import get_page_obj, get_posts
+from .pagination import CachedCountPaginator
+from .utils import (get_comments_page, get_page_obj, get_posts,
+                    get_visible_post)
 
 User = get_user_model()
 
 
+@cache_anonymous_page(FEED_VERSION)
 def index(request):
     template = 'blog/index.html'
-    page_number = request.GET.get('page')
     context = {
-        'page_obj': get_page_obj(get_posts(), page_number)
+        'page_obj': get_page_obj(
+            get_posts(now=visibility_now(request)), request,
+            count_key='feed', schedule_scope={}
+        )
     }
     return render(request, template, context)
 
 
+@cache_anonymous_page(POST_VERSION, CATALOG_VERSION, scheduled=False)
 def post_detail(request, pk):
     template = 'blog/detail.html'
-    post = get_object_or_404(
-        Post.objects.select_related('category', 'location', 'author'),
-        pk=pk
-    )
-    if post.author != request.user:
-        post = get_object_or_404(
-            get_posts(),
-            pk=pk
-        )
+    post = get_visible_post(request, pk)
     context = {
         'post': post,
-        'comments': post.comments.all(),
+        'comments': get_comments_page(post),
         'form': CommentForm()
     }
     return render(request, template, context)
 
 
+@cache_anonymous_page(POST_VERSION, CATALOG_VERSION, scheduled=False)
+def post_comments(request, pk):
+    template = 'includes/comment_list.html'
+    post = get_visible_post(request, pk)
+    context = {
+        'post': post,
+        'comments': get_comments_page(post, request.GET.get(CURSOR_PARAM))
+    }
+    return render(request, template, context)
+
+
+@cache_anonymous_page(FEED_VERSION)
 def category_posts(request, category_slug):
     template = 'blog/category.html'
     category = get_object_or_404(
@@ -49,34 +64,51 @@ def category_posts(request, category_slug):
         is_published=True,
         slug=category_slug
     )
-    page_number = request.GET.get('page')
     context = {
         'category': category,
-        'page_obj': get_page_obj(get_posts(category.posts), page_number)
+        'page_obj': get_page_obj(
+            get_posts(category.posts, now=visibility_now(request)), request,
+            count_key=f'category:{category.slug}',
+            schedule_scope={'category_slug': category.slug}
+        )
     }
     return render(request, template, context)
 
 
-class ProfileListView(ListView):
+class ProfileListView(CursorPaginationMixin, ListView):
     model = Post
     paginate_by = PER_PAGE
     template_name = 'blog/profile.html'
 
-    def get_user(self):
+    @cached_property
+    def profile(self):
+        if self.request.user.get_username() == self.kwargs['username']:
+            return self.request.user
         return get_object_or_404(
-            User,
+            User.objects.only(*PROFILE_USER_FIELDS),
             username=self.kwargs['username']
         )
 
     def get_queryset(self):
-        author = self.get_user()
-        if author == self.request.user:
-            return author.posts.all()
-        return get_posts(author.posts)
+        return get_posts(
+            self.profile.posts,
+            published_only=self.profile != self.request.user,
+            now=visibility_now(self.request)
+        )
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        if self.profile == self.request.user:
+            return CachedCountPaginator(
+                queryset, per_page, f'author:{self.profile.pk}:all', **kwargs
+            )
+        return CachedCountPaginator(
+            queryset, per_page, f'author:{self.profile.pk}',
+            schedule_scope={'author_id': self.profile.pk}, **kwargs
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['profile'] = self.get_user()
+        context['profile'] = self.profile
         return context
 
 
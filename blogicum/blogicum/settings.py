@@ -37,6 +37,7 @@ INSTALLED_APPS = [
     'django_bootstrap5',
     'blog.apps.BlogConfig',
     'pages.apps.PagesConfig',
+    'core.apps.CoreConfig',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -59,11 +60,23 @@ ROOT_URLCONF = 'blogicum.urls'
 
 TEMPLATES_DIR = BASE_DIR / 'templates'
 
+# Продакшен-режим шаблонов: cached loader держит скомпилированные шаблоны
+# в памяти процесса, а wsgi.py компилирует все шаблоны из TEMPLATES_DIR
+# при старте. В разработке шаблоны перечитываются при каждом запросе.
+TEMPLATE_CACHE = not DEBUG
+
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+# Порог времени разбора шаблона для предупреждения core.W001, в секундах.
+TEMPLATE_PARSE_WARNING = 0.05
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [TEMPLATES_DIR],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -71,6 +84,10 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            'loaders': (
+                [('django.template.loaders.cached.Loader', TEMPLATE_LOADERS)]
+                if TEMPLATE_CACHE else TEMPLATE_LOADERS
+            ),
         },
     },
 ]
@@ -89,6 +106,23 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'blog-pages',
+    },
+}
+
+# Алиас из CACHES для полностраничного кэша анонимных страниц блога.
+BLOG_PAGE_CACHE = 'pages'
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -144,6 +178,20 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 MEDIA_URL = "media/"
 
+# Файлы называются по хэшу содержимого: одинаковые загрузки хранятся
+# один раз, а их URL можно кэшировать навсегда.
+DEFAULT_FILE_STORAGE = 'core.storage.ContentAddressedStorage'
+
+# Отдача медиафайлов: None — сам Django (FileResponse), 'nginx' —
+# X-Accel-Redirect на internal-локацию MEDIA_ACCEL_PREFIX, 'apache' —
+# X-Sendfile с абсолютным путём.
+MEDIA_SENDFILE_BACKEND = None
+
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+
+# Срок кэширования файлов без хэша содержимого в имени, в секундах.
+MEDIA_MAX_AGE = 60 * 60
+
 EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
@@ -1,6 +1,10 @@
+import re
+
+from core.media import serve_media
+from django.conf import settings
 from django.contrib import admin
 from django.contrib.auth.forms import UserCreationForm
-from django.urls import include, path, reverse_lazy
+from django.urls import include, path, re_path, reverse_lazy
 from django.views.generic import CreateView
 
 urlpatterns = [
@@ -16,7 +20,12 @@ urlpatterns = [
             success_url=reverse_lazy('blog:index'),
         ),
         name='registration',
-    )
+    ),
+    re_path(
+        r'^{}(?P<path>.+)$'.format(re.escape(settings.MEDIA_URL.lstrip('/'))),
+        serve_media,
+        name='media',
+    ),
 ]
 
 handler404 = 'pages.views.page_not_found'
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+from .templates import compile_templates
+
+
+@register(Tags.templates)
+def check_templates(app_configs, **kwargs):
+    """Ошибки разбора шаблонов — при старте, а не на первом запросе."""
+    messages = []
+    for name, seconds, error in compile_templates():
+        if error is not None:
+            messages.append(Error(
+                f'Шаблон {name} не компилируется: {error}',
+                id='core.E001',
+            ))
+        elif seconds > settings.TEMPLATE_PARSE_WARNING:
+            messages.append(Warning(
+                f'Шаблон {name} компилируется {seconds * 1000:.1f} мс.',
+                hint='Запустите manage.py template_timings.',
+                id='core.W001',
+            ))
+    return messages
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.templates import compile_templates
+
+
+class Command(BaseCommand):
+    help = ('Компилирует все шаблоны проекта и печатает время разбора '
+            'каждого, от медленных к быстрым.')
+
+    def handle(self, *args, **options):
+        timings = sorted(
+            compile_templates(), key=lambda timing: timing[1], reverse=True
+        )
+        for name, seconds, error in timings:
+            self.stdout.write(
+                f'{seconds * 1000:8.2f} мс  {name}'
+                + (f'  ОШИБКА: {error}' if error else '')
+            )
+        total = sum(seconds for _, seconds, _ in timings)
+        self.stdout.write(f'Всего {len(timings)} шаблонов, {total:.3f} с.')
+        failed = [name for name, _, error in timings if error]
+        if failed:
+            raise CommandError(
+                f'Не компилируются шаблоны: {", ".join(failed)}.'
+            )
@@ -0,0 +1,63 @@
+import hashlib
+import os
+import posixpath
+import re
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+# <каталог>/ab/ab…(64 hex).<суффиксы>: имя уже выведено из содержимого.
+CONTENT_NAME = re.compile(r'(^|/)([0-9a-f]{2})/\2[0-9a-f]{62}\.')
+
+
+def content_hash(content):
+    digest = hashlib.sha256()
+    content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk)
+    content.seek(0)
+    return digest.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """Хранилище, называющее файлы по SHA-256 содержимого.
+
+    posts_images/photo.jpg сохраняется как posts_images/ab/ab….jpg;
+    повторная загрузка того же содержимого возвращает имя уже
+    сохранённого файла и обновляет время его изменения. Имена, уже
+    выведенные из хэша, и производные файлы из save_derived() сохраняются
+    как есть. Удалять файл можно только после проверки, что на него больше
+    никто не ссылается и его давно не загружали повторно.
+    """
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        if not CONTENT_NAME.search(name):
+            digest = content_hash(content)
+            name = posixpath.join(
+                posixpath.dirname(name), digest[:2],
+                digest + os.path.splitext(name)[1].lower()
+            )
+            if self._touch(name):
+                return name
+        return super().save(name, content, max_length)
+
+    def save_derived(self, name, content, max_length=None):
+        """Сохраняет файл, производный от оригинала, под заданным именем.
+
+        Копии изображений называются по имени оригинала, в том числе
+        загруженного до хэширования (posts_images/photo.thumb.webp).
+        """
+        return super().save(name, content, max_length)
+
+    def _touch(self, name):
+        # Повторная загрузка продлевает жизнь файлу: release_image не
+        # удалит его, пока ссылающийся пост ещё не сохранён.
+        try:
+            os.utime(self.path(name))
+        except FileNotFoundError:
+            return False
+        return True
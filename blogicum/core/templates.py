@@ -0,0 +1,60 @@
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.template import TemplateSyntaxError, engines
+
+
+def project_engine():
+    return engines['django'].engine
+
+
+def template_paths(engine):
+    """Имена и пути всех шаблонов из каталогов DIRS движка."""
+    paths = {}
+    for directory in map(Path, reversed(engine.dirs)):
+        paths.update(
+            (path.relative_to(directory).as_posix(), path)
+            for path in directory.rglob('*.html')
+        )
+    return dict(sorted(paths.items()))
+
+
+def compile_templates(engine=None):
+    """Компилирует шаблоны проекта и замеряет время каждого.
+
+    С cached loader скомпилированные шаблоны остаются в памяти процесса,
+    и первый запрос их уже не разбирает. Возвращает список
+    (имя, секунды, ошибка или None).
+    """
+    engine = engine or project_engine()
+    paths = template_paths(engine)
+    if paths:
+        # Первый разбор платит за ленивую инициализацию тегов и загрузчиков;
+        # не приписываем её первому по алфавиту шаблону.
+        try:
+            engine.from_string(
+                next(iter(paths.values())).read_text(encoding='utf-8')
+            )
+        except TemplateSyntaxError:
+            pass
+    timings = []
+    for name in paths:
+        start = time.perf_counter()
+        try:
+            engine.get_template(name)
+            error = None
+        except TemplateSyntaxError as exc:
+            error = exc
+        timings.append((name, time.perf_counter() - start, error))
+    return timings
+
+
+def warm_template_cache():
+    """Компилирует шаблоны при старте воркера, если их кэширует загрузчик.
+
+    Вызывается из wsgi.py и asgi.py после создания приложения: первый
+    запрос каждого воркера не должен разбирать шаблоны.
+    """
+    if settings.TEMPLATE_CACHE:
+        compile_templates()
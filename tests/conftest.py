@@ -133,6 +133,33 @@ def another_user_client(another_user):
     return client
 
 
+@pytest.fixture
+def clear_caches():
+    # Страницы и фрагменты из прошлых тестов не должны попадать в ответы.
+    from django.core.cache import cache
+
+    from blog.caching import get_page_cache
+
+    cache.clear()
+    get_page_cache().clear()
+    yield
+    cache.clear()
+    get_page_cache().clear()
+
+
+def rename_silently(post, title):
+    # update() не шлёт сигналов: кэш обновится только по инвалидации.
+    post._meta.model.objects.filter(pk=post.pk).update(title=title)
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    # Отдельный MEDIA_ROOT: одинаковые загрузки разных тестов не делят
+    # один файл и его копии.
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
 def get_post_list_context_key(
         user_client, page_url, page_load_err_msg, key_missing_msg
 ):
@@ -363,6 +390,7 @@ def cleanup(request):
                     filename.endswith(".jpg")
                     or filename.endswith(".gif")
                     or filename.endswith(".png")
+                    or filename.endswith(".webp")
             ):
                 file_path = os.path.join(root, filename)
                 if os.path.getmtime(file_path) >= start_time:
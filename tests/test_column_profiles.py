@@ -0,0 +1,65 @@
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Model
+from django.test.utils import CaptureQueriesContext
+
+from blog.caching import get_page_cache
+
+pytestmark = [pytest.mark.django_db]
+
+PAGES = (
+    "/",
+    "/category/{post.category.slug}/",
+    "/profile/{post.author.username}/",
+    "/posts/{post.id}/",
+    "/posts/{post.id}/comments/",
+)
+
+
+@pytest.fixture
+def forbid_deferred_loading(monkeypatch):
+    original = Model.refresh_from_db
+
+    def refresh_from_db(self, using=None, fields=None):
+        # Так Django догружает отложенное поле: по запросу на строку.
+        if fields is not None:
+            raise AssertionError(
+                f"Шаблон обратился к отложенному полю {fields} модели"
+                f" {type(self).__name__}; добавьте его в профиль столбцов."
+            )
+        return original(self, using=using, fields=fields)
+
+    monkeypatch.setattr(Model, "refresh_from_db", refresh_from_db)
+
+
+@pytest.mark.parametrize(
+    "client_name", ["client", "user_client", "another_user_client"]
+)
+def test_templates_do_not_load_deferred_fields(
+    request, mixer, user, post_with_published_location,
+    forbid_deferred_loading, client_name
+):
+    client = request.getfixturevalue(client_name)
+    post = post_with_published_location
+    mixer.cycle(3).blend("blog.Comment", post=post, author=user)
+    # Готовые копии изображения: карточка выводит srcset.
+    call_command("run_worker", once=True)
+    for page in PAGES:
+        cache.clear()
+        get_page_cache().clear()
+        url = page.format(post=post)
+        assert client.get(url).status_code == 200, url
+
+
+def test_feed_skips_unused_columns(client, post_with_published_location):
+    get_page_cache().clear()
+    with CaptureQueriesContext(connection) as queries:
+        client.get("/")
+    sql = "\n".join(query["sql"] for query in queries)
+    for column in ('"auth_user"."password"', '"blog_category"."description"',
+                   '"blog_post"."text"'):
+        assert column not in sql, (
+            f"Убедитесь, что лента не выбирает столбец {column}."
+        )
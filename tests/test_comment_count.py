@@ -0,0 +1,60 @@
+import pytest
+from django.core.management import CommandError, call_command
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _stored_count(post):
+    return Post.objects.values_list("comment_count", flat=True).get(
+        pk=post.pk
+    )
+
+
+def test_comment_count_follows_comments(
+    mixer, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    user_client.post(f"/posts/{post.id}/comment/", {"text": "Первый"})
+    comments = mixer.cycle(2).blend("blog.Comment", post=post)
+    assert _stored_count(post) == 3, (
+        "Убедитесь, что `Post.comment_count` увеличивается при добавлении"
+        " комментария."
+    )
+
+    comments[0].delete()
+    Comment.objects.filter(pk=comments[1].pk).delete()
+    assert _stored_count(post) == 1, (
+        "Убедитесь, что `Post.comment_count` уменьшается при удалении"
+        " комментария, в том числе массовом удалении из админки."
+    )
+
+
+def test_recount_comments_command(mixer, post_with_published_location):
+    post = post_with_published_location
+    mixer.cycle(2).blend("blog.Comment", post=post)
+    Post.objects.filter(pk=post.pk).update(comment_count=7)
+
+    with pytest.raises(CommandError):
+        call_command("recount_comments", "--check")
+    assert _stored_count(post) == 7
+
+    call_command("recount_comments")
+    assert _stored_count(post) == 2
+    call_command("recount_comments", "--check")
+
+
+def test_recount_comments_refreshes_cached_pages(
+    mixer, client, clear_caches, post_with_published_location
+):
+    post = post_with_published_location
+    mixer.cycle(2).blend("blog.Comment", post=post)
+    Post.objects.filter(pk=post.pk).update(comment_count=7)
+    assert "Комментарии (7)" in client.get("/").content.decode()
+
+    call_command("recount_comments")
+    assert "Комментарии (2)" in client.get("/").content.decode(), (
+        "Убедитесь, что `recount_comments` сбрасывает кэш страниц"
+        " и карточек исправленных постов."
+    )
@@ -0,0 +1,51 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.template.defaultfilters import truncatewords
+from django.test.utils import CaptureQueriesContext
+
+from blog.caching import get_page_cache
+from blog.models import Post
+from blog.utils import get_posts
+
+pytestmark = [pytest.mark.django_db]
+
+LONG_TEXT = "Раз два три\nчетыре <b>пять</b> шесть семь восемь девять десять"
+
+
+def test_excerpt_matches_truncatewords(post_with_published_location):
+    post = post_with_published_location
+    post.text = LONG_TEXT + " одиннадцать двенадцать"
+    post.save()
+    post.refresh_from_db()
+    assert post.excerpt == truncatewords(post.text, 10), (
+        "Убедитесь, что `Post.excerpt` совпадает с `truncatewords:10`."
+    )
+
+    post.text = "Короткий текст"
+    post.save(update_fields=["text"])
+    post.refresh_from_db()
+    assert post.excerpt == "Короткий текст", (
+        "Убедитесь, что выдержка обновляется и при `save(update_fields=...)`."
+    )
+
+
+def test_feed_does_not_load_text(
+    client, many_posts_with_published_locations
+):
+    newest = get_posts().first()
+    assert "text" in newest.get_deferred_fields()
+    get_page_cache().clear()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/")
+    assert response.status_code == 200
+    assert not any(
+        '"blog_post"."text"' in query["sql"] for query in queries
+    ), "Убедитесь, что лента не загружает полный текст публикаций."
+    assert newest.excerpt in response.content.decode()
+
+
+def test_seed_blog_fills_excerpt():
+    call_command("seed_blog", verbosity=0, users=2, posts=5, comments=0)
+    for text, excerpt in Post.objects.values_list("text", "excerpt"):
+        assert excerpt == truncatewords(text, 10)
@@ -0,0 +1,45 @@
+import pytest
+from django.db import connection
+
+from blog.utils import get_posts
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def feed_data(mixer, user, published_category):
+    return mixer.cycle(30).blend(
+        "blog.Post", author=user, category=published_category
+    )
+
+
+@pytest.mark.skipif(
+    connection.vendor != "sqlite", reason="План запроса проверяется на SQLite"
+)
+@pytest.mark.parametrize(
+    ("queryset_name", "index_name"),
+    [
+        ("feed", "post_feed_idx"),
+        ("category", "post_category_feed_idx"),
+        ("profile", "post_author_feed_idx"),
+        ("own_profile", "post_author_feed_idx"),
+    ],
+)
+def test_feed_queries_use_indexes(
+    feed_data, user, published_category, queryset_name, index_name
+):
+    queryset = {
+        "feed": lambda: get_posts(),
+        "category": lambda: get_posts(published_category.posts),
+        "profile": lambda: get_posts(user.posts),
+        "own_profile": lambda: get_posts(user.posts, published_only=False),
+    }[queryset_name]()
+    plan = queryset[:10].explain()
+    assert f"USING INDEX {index_name}" in plan, (
+        f"Убедитесь, что запрос ленты `{queryset_name}` использует индекс"
+        f" `{index_name}`. План запроса:\n{plan}"
+    )
+    assert "TEMP B-TREE" not in plan, (
+        f"Убедитесь, что запрос ленты `{queryset_name}` сортируется по"
+        f" индексу, без временного B-дерева. План запроса:\n{plan}"
+    )
@@ -0,0 +1,52 @@
+import pytest
+from django.core.cache import cache
+from django.template import Context, Engine, Template, TemplateSyntaxError
+from django.template.loader_tags import IncludeNode
+
+pytestmark = [pytest.mark.django_db]
+
+LOOP = (
+    "{% load blog_tags %}{% for post in posts %}"
+    "{% TAG 'includes/post_card.html' %}{% endfor %}"
+)
+
+
+def _template(tag):
+    return Engine.get_default().from_string(LOOP.replace("TAG", tag))
+
+
+def _render(tag, context):
+    # Без кэша фрагментов карточки: сравниваем настоящий рендер.
+    cache.clear()
+    return _template(tag).render(Context(context))
+
+
+def _nodes(nodelist):
+    for node in nodelist:
+        yield node
+        for attr in node.child_nodelists:
+            yield from _nodes(getattr(node, attr, None) or ())
+
+
+def test_inline_include_renders_like_include(
+    rf, user, many_posts_with_published_locations
+):
+    context = {
+        "posts": many_posts_with_published_locations[:3],
+        "user": user,
+        "request": rf.get("/"),
+    }
+    assert _render("inline_include", context) == _render("include", context)
+    assert not any(
+        isinstance(node, IncludeNode)
+        for node in _nodes(_template("inline_include").nodelist)
+    ), "Убедитесь, что вложенные include тоже разворачиваются."
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["{% inline_include name %}", "{% inline_include 'blog/index.html' %}"],
+)
+def test_inline_include_errors(source):
+    with pytest.raises(TemplateSyntaxError):
+        Template("{% load blog_tags %}" + source)
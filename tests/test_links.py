@@ -0,0 +1,65 @@
+import pytest
+from django.urls import NoReverseMatch, get_resolver, reverse
+from django.urls.base import get_script_prefix, set_script_prefix
+from django.urls.resolvers import URLPattern
+
+from blog.links import blog_url
+
+# Примеры аргументов по именам параметров маршрутов blog/urls.py.
+SAMPLE_ARGS = {
+    "pk": 7,
+    "post_id": 42,
+    "username": "author_1",
+    "category_slug": "travel-notes",
+}
+
+
+def _blog_routes():
+    resolver = get_resolver().namespace_dict["blog"][1]
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLPattern) and pattern.name:
+            params = list(pattern.pattern.converters)
+            yield f"blog:{pattern.name}", [SAMPLE_ARGS[p] for p in params]
+
+
+@pytest.fixture
+def script_prefix():
+    original = get_script_prefix()
+    yield set_script_prefix
+    set_script_prefix(original)
+
+
+@pytest.mark.parametrize("prefix", ["/", "/мой блог/"])
+def test_blog_url_matches_reverse(script_prefix, prefix):
+    script_prefix(prefix)
+    routes = list(_blog_routes())
+    assert len(routes) == 12
+    for name, args in routes:
+        assert blog_url(name, *args) == reverse(name, args=args), (
+            f"Убедитесь, что адрес `{name}` совпадает с reverse()."
+        )
+
+
+@pytest.mark.parametrize(
+    ("name", "args"),
+    [
+        ("blog:profile", ["user.name"]),
+        ("blog:post_detail", ["abc"]),
+        ("blog:post_detail", []),
+        ("blog:missing", []),
+    ],
+)
+def test_blog_url_raises_like_reverse(name, args):
+    with pytest.raises(NoReverseMatch):
+        reverse(name, args=args)
+    with pytest.raises(NoReverseMatch):
+        blog_url(name, *args)
+
+
+@pytest.mark.django_db
+def test_model_urls(post_with_published_location):
+    post = post_with_published_location
+    assert post.get_absolute_url() == f"/posts/{post.id}/"
+    assert post.category.get_absolute_url() == (
+        f"/category/{post.category.slug}/"
+    )
@@ -0,0 +1,83 @@
+import pytest
+from django.test import override_settings
+
+CONTENT = b"0123456789" * 10
+HASHED_NAME = "posts_images/ab/ab" + "0" * 62 + ".jpg"
+
+
+@pytest.fixture(autouse=True)
+def media_files(media_root):
+    (media_root / "posts_images" / "ab").mkdir(parents=True)
+    (media_root / "posts_images" / "photo.jpg").write_bytes(CONTENT)
+    (media_root / HASHED_NAME).write_bytes(CONTENT)
+    return media_root
+
+
+def _body(response):
+    return b"".join(response.streaming_content)
+
+
+def test_media_served_with_validators(client):
+    response = client.get("/media/posts_images/photo.jpg")
+    assert response.status_code == 200
+    assert _body(response) == CONTENT
+    assert response["Content-Type"] == "image/jpeg"
+    assert response["ETag"] and response["Last-Modified"]
+    assert "immutable" not in response["Cache-Control"]
+
+    not_modified = client.get(
+        "/media/posts_images/photo.jpg",
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+    assert not_modified.status_code == 304, (
+        "Убедитесь, что при совпадении ETag отдаётся 304 Not Modified."
+    )
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [("bytes=2-5", CONTENT[2:6]), ("bytes=95-", CONTENT[95:]),
+     ("bytes=-3", CONTENT[-3:])],
+)
+def test_media_range(client, header, expected):
+    response = client.get("/media/posts_images/photo.jpg", HTTP_RANGE=header)
+    assert response.status_code == 206
+    assert _body(response) == expected
+    assert response["Content-Length"] == str(len(expected))
+
+
+def test_media_range_errors(client):
+    response = client.get(
+        "/media/posts_images/photo.jpg", HTTP_RANGE="bytes=500-"
+    )
+    assert response.status_code == 416
+    assert response["Content-Range"] == f"bytes */{len(CONTENT)}"
+    stale = client.get(
+        "/media/posts_images/photo.jpg", HTTP_RANGE="bytes=2-5",
+        HTTP_IF_RANGE='"stale"',
+    )
+    assert stale.status_code == 200, (
+        "Убедитесь, что при несовпадении If-Range файл отдаётся целиком."
+    )
+
+
+def test_hashed_media_is_immutable(client):
+    response = client.get(f"/media/{HASHED_NAME}")
+    assert "immutable" in response["Cache-Control"]
+    assert "max-age=31536000" in response["Cache-Control"]
+
+
+@pytest.mark.parametrize(
+    "url", ["/media/../settings.py", "/media/posts_images/", "/media/no.jpg"]
+)
+def test_media_not_found(client, url):
+    assert client.get(url).status_code == 404
+
+
+def test_media_x_accel_redirect(client):
+    with override_settings(MEDIA_SENDFILE_BACKEND="nginx"):
+        response = client.get("/media/posts_images/photo.jpg")
+    assert response["X-Accel-Redirect"] == (
+        "/protected-media/posts_images/photo.jpg"
+    )
+    assert response.content == b""
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from blog import caching
+from blog.constants import VISIBILITY_GRANULARITY
+from conftest import rename_silently
+
+pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("clear_caches")]
+
+
+@pytest.mark.parametrize("page", ["index", "category", "detail"])
+def test_anonymous_pages_cached_and_invalidated(
+    page, client, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    url = {
+        "index": "/",
+        "category": f"/category/{post.category.slug}/",
+        "detail": f"/posts/{post.id}/",
+    }[page]
+    assert post.title in client.get(url).content.decode()
+
+    rename_silently(post, "Тихо переименован")
+    assert "Тихо переименован" not in client.get(url).content.decode(), (
+        "Убедитесь, что страница для анонимного пользователя кэшируется."
+    )
+    assert "Тихо переименован" in user_client.get(url).content.decode(), (
+        "Убедитесь, что авторизованным пользователям страница не отдаётся"
+        " из кэша."
+    )
+
+    post.refresh_from_db()
+    post.title = "Переименован"
+    post.save()
+    assert "Переименован" in client.get(url).content.decode(), (
+        "Убедитесь, что кэш страницы сбрасывается при изменении публикации."
+    )
+
+
+def test_category_unpublish_drops_cached_detail(
+    client, post_with_published_location
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    assert client.get(url).status_code == 200
+    post.category.is_published = False
+    post.category.save()
+    assert client.get(url).status_code == 404, (
+        "Убедитесь, что кэш страницы публикации сбрасывается при снятии"
+        " категории с публикации."
+    )
+
+
+def test_page_expires_with_next_scheduled_post(
+    mixer, client, monkeypatch, post_with_published_location
+):
+    mixer.blend(
+        "blog.Post",
+        is_published=True,
+        category=post_with_published_location.category,
+        pub_date=timezone.now() + timedelta(seconds=30),
+    )
+    page_cache = caching.get_page_cache()
+    timeouts = []
+    original_set = page_cache.set
+
+    def spy_set(key, value, timeout=None, *args, **kwargs):
+        timeouts.append(timeout)
+        return original_set(key, value, timeout, *args, **kwargs)
+
+    monkeypatch.setattr(page_cache, "set", spy_set)
+    client.get("/")
+    # Отложенный пост виден с ближайшего шага VISIBILITY_GRANULARITY.
+    assert timeouts and timeouts[-1] <= 31 + VISIBILITY_GRANULARITY, (
+        "Убедитесь, что закэшированная лента истекает к моменту выхода"
+        " ближайшей отложенной публикации."
+    )
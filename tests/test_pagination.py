@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+from blog.constants import COMMENTS_PER_PAGE
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def feed_posts(mixer: Mixer, user, published_category):
+    now = timezone.now()
+    # Попарно одинаковые даты: курсор должен различать их по `id`.
+    pub_dates = (
+        now - timedelta(hours=1 + i // 2) for i in range(N_PER_PAGE * 2 + 5)
+    )
+    return mixer.cycle(N_PER_PAGE * 2 + 5).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=pub_dates,
+    )
+
+
+def _walk_forward(client, url):
+    seen, cursor = [], ""
+    while cursor is not None:
+        page = client.get(url, {"cursor": cursor}).context["page_obj"]
+        seen.extend(post.id for post in page)
+        cursor = page.next_cursor()
+    return seen
+
+
+@pytest.mark.parametrize("url_name", ["index", "category", "profile"])
+def test_cursor_pagination(
+    url_name, feed_posts, user, user_client, another_user_client,
+    published_category
+):
+    url = {
+        "index": "/",
+        "category": f"/category/{published_category.slug}/",
+        "profile": f"/profile/{user.username}/",
+    }[url_name]
+    expected = [
+        post.id for post in sorted(
+            feed_posts, key=lambda p: (p.pub_date, p.id), reverse=True
+        )
+    ]
+    client = another_user_client if url_name == "profile" else user_client
+    forward = _walk_forward(client, url)
+    assert forward == expected, (
+        "Убедитесь, что курсорная пагинация проходит все публикации по"
+        " одному разу в порядке «от новых к старым»."
+    )
+
+    last_page = client.get(url, {"cursor": ""}).context["page_obj"]
+    while last_page.has_next():
+        last_page = client.get(
+            url, {"cursor": last_page.next_cursor()}
+        ).context["page_obj"]
+    backward = []
+    page = last_page
+    while page.has_previous():
+        page = client.get(
+            url, {"cursor": page.previous_cursor()}
+        ).context["page_obj"]
+        backward = [post.id for post in page] + backward
+    assert backward + [post.id for post in last_page] == expected, (
+        "Убедитесь, что курсорная пагинация корректно листает назад."
+    )
+
+
+def test_broken_cursor_shows_first_page(feed_posts, user_client):
+    response = user_client.get("/", {"cursor": "not-a-cursor"})
+    assert response.status_code == 200
+    assert len(response.context["page_obj"]) == N_PER_PAGE
+
+
+def test_comments_paginated_with_fragment(
+    mixer, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    comments = mixer.cycle(COMMENTS_PER_PAGE + 5).blend(
+        "blog.Comment", post=post
+    )
+    response = user_client.get(f"/posts/{post.id}/")
+    page = response.context["comments"]
+    assert [c.id for c in page] == [c.id for c in comments][
+        :COMMENTS_PER_PAGE
+    ], (
+        "Убедитесь, что на странице публикации выводится первая страница"
+        " комментариев в порядке их создания."
+    )
+    more_url = f"/posts/{post.id}/comments/?cursor={page.next_cursor()}"
+    assert more_url in response.content.decode(), (
+        "Убедитесь, что на странице публикации есть ссылка на следующую"
+        " порцию комментариев."
+    )
+
+    fragment = user_client.get(more_url)
+    assert [c.id for c in fragment.context["comments"]] == [
+        c.id for c in comments
+    ][COMMENTS_PER_PAGE:]
+    assert "<html" not in fragment.content.decode(), (
+        "Убедитесь, что следующая порция комментариев отдаётся фрагментом"
+        " без базового шаблона."
+    )
@@ -0,0 +1,20 @@
+from django.template.loader import render_to_string
+
+from blog.constants import PER_PAGE
+from blog.pagination import FeedPaginator
+
+
+def _render(n_posts):
+    paginator = FeedPaginator(range(n_posts), PER_PAGE)
+    page = paginator.get_page(paginator.num_pages // 2)
+    return render_to_string("includes/paginator.html", {"page_obj": page})
+
+
+def test_paginator_render_is_flat():
+    small_html, big_html = _render(1_000), _render(1_000_000)
+    assert big_html.count("<li") == small_html.count("<li"), (
+        "Убедитесь, что пагинатор выводит окно страниц вокруг текущей, а не"
+        " ссылку на каждую страницу."
+    )
+    # Разница — только в ширине номеров страниц.
+    assert len(big_html) - len(small_html) < 200
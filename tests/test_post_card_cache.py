@@ -0,0 +1,70 @@
+import pytest
+from django.core.cache import cache
+
+from blog.caching import get_page_cache, post_card_keys
+from blog.constants import POST_CARD_TIMEOUT
+from conftest import rename_silently
+
+pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("clear_caches")]
+
+
+def test_post_card_served_from_cache(
+    mixer, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    assert post.title in user_client.get("/").content.decode()
+
+    rename_silently(post, "Заголовок из базы")
+    assert "Заголовок из базы" not in user_client.get("/").content.decode(), (
+        "Убедитесь, что карточки публикаций в ленте кэшируются."
+    )
+
+    mixer.blend("blog.Comment", post=post)
+    content = user_client.get("/").content.decode()
+    assert "Заголовок из базы" in content and "(1)" in content, (
+        "Убедитесь, что кэш карточки сбрасывается при добавлении комментария."
+    )
+
+
+def test_post_card_invalidated_on_related_changes(
+    user_client, post_with_published_location
+):
+    post = post_with_published_location
+    user_client.get("/")
+
+    rename_silently(post, "Переименован")
+    post.location.is_published = False
+    post.location.save()
+    assert "Переименован" in user_client.get("/").content.decode(), (
+        "Убедитесь, что кэш карточки сбрасывается при снятии с публикации"
+        " местоположения."
+    )
+
+    rename_silently(post, "Снова переименован")
+    post.category.title = "Новая категория"
+    post.category.save()
+    assert "Снова переименован" in user_client.get("/").content.decode(), (
+        "Убедитесь, что кэш карточки сбрасывается при изменении категории."
+    )
+
+
+def test_post_card_fragment_matches_invalidation_keys(
+    monkeypatch, client, post_with_published_location
+):
+    post = post_with_published_location
+    timeouts = {}
+    original_set = cache.set
+
+    def spy_set(key, value, timeout=None, *args, **kwargs):
+        timeouts[key] = timeout
+        return original_set(key, value, timeout, *args, **kwargs)
+
+    monkeypatch.setattr(cache, "set", spy_set)
+    get_page_cache().clear()
+    client.get("/")
+    anonymous_key = post_card_keys([post.id])[1]
+    assert anonymous_key in timeouts, (
+        "Убедитесь, что имя фрагмента {% cache %} карточки совпадает с"
+        " POST_CARD_FRAGMENT: иначе карточка не сбрасывается."
+    )
+    assert timeouts[anonymous_key] == POST_CARD_TIMEOUT
@@ -0,0 +1,134 @@
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.caching import get_page_cache
+
+pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("clear_caches")]
+
+
+def count_queries(client, url, expected_status=200):
+    # Холодный кэш: считаем полную стоимость страницы.
+    get_page_cache().clear()
+    cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == expected_status
+    return len(queries)
+
+
+@pytest.mark.parametrize(
+    ("client_name", "expected_queries"),
+    [
+        # пост, комментарии с авторами
+        ("client", 2),
+        # сессия, пользователь, пост, комментарии с авторами
+        ("user_client", 4),
+    ],
+)
+def test_post_detail_query_count(
+    request, mixer, post_with_published_location, client_name,
+    expected_queries
+):
+    client = request.getfixturevalue(client_name)
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    # Копии изображения готовы: иначе страница ставит их в очередь.
+    call_command("run_worker", once=True)
+    counts = []
+    for n_comments in (1, 15):
+        mixer.cycle(n_comments).blend("blog.Comment", post=post)
+        counts.append(count_queries(client, url))
+    assert counts == [expected_queries] * 2, (
+        "Убедитесь, что число запросов на странице публикации не зависит от"
+        f" числа комментариев и равно {expected_queries}; получено {counts}."
+    )
+
+
+@pytest.mark.parametrize(
+    ("url_template", "table", "expected_queries"),
+    [
+        # пост, сессия, пользователь, выборы местоположения и категории
+        ("/posts/{post}/edit/", "blog_post", 5),
+        # пост, сессия, пользователь
+        ("/posts/{post}/delete/", "blog_post", 3),
+        # комментарий, сессия, пользователь
+        ("/posts/{post}/edit_comment/{comment}/", "blog_comment", 3),
+        ("/posts/{post}/delete_comment/{comment}/", "blog_comment", 3),
+    ],
+)
+def test_edit_and_delete_pages_load_object_once(
+    mixer, user, user_client, post_with_published_location,
+    url_template, table, expected_queries
+):
+    post = post_with_published_location
+    comment = mixer.blend("blog.Comment", post=post, author=user)
+    url = url_template.format(post=post.id, comment=comment.id)
+    with CaptureQueriesContext(connection) as queries:
+        assert user_client.get(url).status_code == 200
+    object_selects = [
+        query["sql"] for query in queries
+        if query["sql"].startswith("SELECT")
+        and f'FROM "{table}"' in query["sql"]
+    ]
+    assert len(object_selects) == 1, (
+        f"Убедитесь, что страница `{url_template}` загружает объект из"
+        f" `{table}` один раз, а не повторно в `get_object()`."
+    )
+    assert len(queries) == expected_queries, (
+        f"Убедитесь, что страница `{url_template}` выполняет"
+        f" {expected_queries} запросов; получено {len(queries)}."
+    )
+
+
+@pytest.mark.parametrize(
+    ("client_name", "expected_queries"),
+    [
+        # автор, COUNT, ближайшая отложенная публикация, публикации
+        ("client", 4),
+        # сессия, пользователь (он же автор), COUNT, публикации
+        ("user_client", 4),
+        ("another_user_client", 6),
+    ],
+)
+def test_profile_query_count_is_constant(
+    request, mixer, user, published_category, published_location,
+    client_name, expected_queries
+):
+    client = request.getfixturevalue(client_name)
+    url = f"/profile/{user.username}/"
+    counts = []
+    for n_posts, pages in ((3, [""]), (25, ["", "?page=2"])):
+        mixer.cycle(n_posts).blend(
+            "blog.Post", author=user, category=published_category,
+            location=published_location,
+        )
+        counts.extend(count_queries(client, url + page) for page in pages)
+    assert counts == [expected_queries] * 3, (
+        "Убедитесь, что число запросов на странице пользователя не зависит"
+        f" от числа публикаций и равно {expected_queries}; получено {counts}."
+    )
+
+
+def test_feed_count_is_cached(
+    mixer, user_client, many_posts_with_published_locations
+):
+    def count_selects():
+        with CaptureQueriesContext(connection) as queries:
+            user_client.get("/?page=2")
+        return sum("COUNT(" in query["sql"] for query in queries)
+
+    assert count_selects() == 1
+    assert count_selects() == 0, (
+        "Убедитесь, что число публикаций для пагинатора берётся из кэша."
+    )
+    mixer.blend("blog.Post", **{
+        field: getattr(many_posts_with_published_locations[0], field)
+        for field in ("author", "category", "location")
+    })
+    assert count_selects() == 1, (
+        "Убедитесь, что кэш числа публикаций сбрасывается при изменении"
+        " публикаций."
+    )
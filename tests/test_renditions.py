@@ -0,0 +1,107 @@
+from io import BytesIO
+
+import pytest
+from bs4 import BeautifulSoup
+from django.core.files.images import ImageFile
+from django.core.management import call_command
+from PIL import Image
+
+from blog.constants import IMAGE_RENDITIONS
+from blog.models import Task
+from blog.renditions import get_renditions
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.usefixtures("clear_caches", "media_root"),
+]
+
+
+@pytest.fixture
+def post_with_large_image(mixer, user, published_location, published_category):
+    image_io = BytesIO()
+    Image.new("RGB", (3000, 2000), color=(73, 109, 137)).save(
+        image_io, format="JPEG"
+    )
+    return mixer.blend(
+        "blog.Post",
+        author=user,
+        location=published_location,
+        category=published_category,
+        image=ImageFile(image_io, name="large_image.jpg"),
+    )
+
+
+def run_worker():
+    call_command("run_worker", once=True)
+
+
+def test_renditions_built_by_worker(post_with_large_image):
+    assert get_renditions(post_with_large_image.image) is None, (
+        "Убедитесь, что копии изображения не создаются в запросе загрузки."
+    )
+    run_worker()
+    renditions = get_renditions(post_with_large_image.image)
+    storage = post_with_large_image.image.storage
+    for size, side in IMAGE_RENDITIONS.items():
+        rendition = renditions[size]
+        assert max(rendition["width"], rendition["height"]) == side
+        for url in (rendition["url"], rendition["webp"]):
+            name = url[len(storage.base_url):]
+            assert storage.exists(name), (
+                "Убедитесь, что копии изображения сохраняются рядом с"
+                " оригиналом."
+            )
+            with storage.open(name) as file, Image.open(file) as image:
+                assert image.width == rendition["width"]
+
+
+@pytest.mark.parametrize(
+    ("url", "size"), [("/", "thumb"), ("/posts/{pk}/", "detail")]
+)
+def test_pages_use_renditions(client, post_with_large_image, url, size):
+    url = url.format(pk=post_with_large_image.pk)
+    soup = BeautifulSoup(client.get(url).content, features="html.parser")
+    assert soup.find("picture") is None
+    assert post_with_large_image.image.url in [
+        img["src"] for img in soup.find_all("img")
+    ], "Убедитесь, что до готовности копий показывается оригинал."
+
+    run_worker()
+    renditions = get_renditions(post_with_large_image.image)
+    content = client.get(url).content
+    picture = BeautifulSoup(content, features="html.parser").find("picture")
+    assert picture is not None
+    img = picture.find("img")
+    assert img["src"] == renditions[size]["url"], (
+        "Убедитесь, что вместо оригинала показывается уменьшенная копия."
+    )
+    assert renditions["detail"]["url"] in img["srcset"]
+    assert renditions["thumb"]["webp"] in picture.find("source")["srcset"]
+
+
+def test_unreadable_image_falls_back_to_original(
+    mixer, user, published_category
+):
+    post = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        image=ImageFile(BytesIO(b"not an image"), name="broken.jpg"),
+    )
+    run_worker()
+    assert get_renditions(post.image) is None
+    job = Task.objects.get()
+    assert job.status == Task.PENDING and job.attempts == 1, (
+        "Убедитесь, что задача с ошибкой откладывается для повтора."
+    )
+    assert "Error" in job.error
+
+
+def test_failed_build_is_not_queued_again(user_client, post_with_large_image):
+    post = post_with_large_image
+    post.image.storage.delete(post.image.name)
+    for _ in range(5):
+        run_worker()
+        assert user_client.get(f"/posts/{post.pk}/").status_code == 200
+    assert Task.objects.filter(name="build_post_renditions").count() == 1, (
+        "Убедитесь, что пока задача копий ждёт повтора, новая для того же"
+        " поста не ставится."
+    )
@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from blog.clock import visibility_now, visible_since
+from blog.caching import get_page_cache
+from blog.constants import PAGE_CACHE_TIMEOUT, VISIBILITY_GRANULARITY
+from blog.scheduling import next_publication, seconds_until_next_publication
+
+pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("clear_caches")]
+
+
+def _schedule(mixer, category, user, hours):
+    return mixer.blend(
+        "blog.Post",
+        author=user,
+        category=category,
+        is_published=True,
+        pub_date=timezone.now() + timedelta(hours=hours),
+    )
+
+
+def test_next_publication_is_cached_per_scope(
+    mixer, user, published_category, another_category,
+    django_assert_num_queries
+):
+    assert next_publication() is None
+    later = _schedule(mixer, published_category, user, hours=5)
+    sooner = _schedule(mixer, another_category, user, hours=1)
+
+    assert next_publication() == visible_since(sooner.pub_date)
+    assert next_publication(
+        category_slug=published_category.slug
+    ) == visible_since(later.pub_date)
+    assert next_publication(author_id=user.id) == visible_since(
+        sooner.pub_date
+    )
+    with django_assert_num_queries(0):
+        assert next_publication() == visible_since(sooner.pub_date)
+    assert 3500 < seconds_until_next_publication() <= 3661
+
+
+def test_next_publication_forgotten_on_changes(
+    mixer, user, published_category
+):
+    later = _schedule(mixer, published_category, user, hours=5)
+    assert next_publication() == visible_since(later.pub_date)
+
+    sooner = _schedule(mixer, published_category, user, hours=1)
+    assert next_publication() == visible_since(sooner.pub_date), (
+        "Убедитесь, что новая отложенная публикация сбрасывает кэш"
+        " ближайшей публикации."
+    )
+
+    published_category.is_published = False
+    published_category.save()
+    assert next_publication() is None, (
+        "Убедитесь, что снятие категории с публикации сбрасывает кэш"
+        " ближайшей публикации."
+    )
+
+
+def test_visibility_now_is_rounded_and_fixed_per_request(rf):
+    request = rf.get("/")
+    now = visibility_now(request)
+    assert now.tzinfo is not None
+    assert now.timestamp() % VISIBILITY_GRANULARITY == 0, (
+        "Убедитесь, что момент видимости округляется до"
+        " VISIBILITY_GRANULARITY."
+    )
+    assert visibility_now(request) is now, (
+        "Убедитесь, что момент видимости фиксируется на весь запрос."
+    )
+
+
+def test_next_publication_marker_shares_page_cache(monkeypatch):
+    page_cache = get_page_cache()
+    timeouts = []
+    original_set = page_cache.set
+
+    def spy_set(key, value, timeout=None, *args, **kwargs):
+        timeouts.append(timeout)
+        return original_set(key, value, timeout, *args, **kwargs)
+
+    monkeypatch.setattr(page_cache, "set", spy_set)
+    assert next_publication() is None
+    assert timeouts == [PAGE_CACHE_TIMEOUT], (
+        "Убедитесь, что отметка «нет отложенных публикаций» хранится в кэше"
+        " страниц и с конечным сроком."
+    )
+    assert not cache.get("blog:next_publication:all")
@@ -0,0 +1,62 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import Count, F
+
+from blog.models import Category, Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+User = get_user_model()
+
+SIZES = dict(users=20, categories=5, locations=5, posts=300, comments=2000)
+
+
+def _snapshot():
+    return list(Post.objects.order_by("id").values_list(
+        "title", "author__username", "category__slug", "is_published",
+        "comment_count",
+    ))
+
+
+def test_seed_blog_creates_requested_volumes():
+    call_command("seed_blog", verbosity=0, seed=1, **SIZES)
+    assert User.objects.count() == SIZES["users"]
+    assert Category.objects.count() == SIZES["categories"]
+    assert Post.objects.count() == SIZES["posts"]
+    assert Comment.objects.count() == SIZES["comments"]
+    assert not Post.objects.annotate(
+        actual=Count("comments")
+    ).exclude(comment_count=F("actual")).exists(), (
+        "Убедитесь, что `seed_blog` заполняет `Post.comment_count`."
+    )
+    top_author_posts = User.objects.annotate(
+        n=Count("posts")
+    ).order_by("-n").values_list("n", flat=True).first()
+    assert top_author_posts > SIZES["posts"] / SIZES["users"] * 3, (
+        "Убедитесь, что публикации сосредоточены у активных авторов."
+    )
+
+
+def test_seed_blog_is_deterministic():
+    call_command("seed_blog", verbosity=0, seed=7, **SIZES)
+    first = _snapshot()
+    Post.objects.all().delete()
+    User.objects.all().delete()
+    Category.objects.all().delete()
+    call_command("seed_blog", verbosity=0, seed=7, **SIZES)
+    assert _snapshot() == first, (
+        "Убедитесь, что одинаковый `--seed` даёт одинаковые данные."
+    )
+
+
+def test_seed_blog_resets_cached_pages(client, clear_caches):
+    assert "Публикация" not in client.get("/").content.decode()
+    call_command(
+        "seed_blog", verbosity=0, seed=1, users=2, categories=1, posts=5,
+        comments=0, scheduled=0, unpublished_posts=0,
+        unpublished_categories=0,
+    )
+    assert "Публикация" in client.get("/").content.decode(), (
+        "Убедитесь, что `seed_blog` сбрасывает кэш страниц."
+    )
@@ -0,0 +1,148 @@
+from io import BytesIO
+
+import pytest
+from django.core.cache import cache
+from django.core.files.images import ImageFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from PIL import Image
+
+from blog import renditions
+from blog.constants import IMAGE_RENDITIONS
+from blog.models import Post, Task
+from core.storage import CONTENT_NAME
+
+pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("media_root")]
+
+
+def _image(color):
+    image_io = BytesIO()
+    Image.new("RGB", (50, 50), color=color).save(image_io, format="PNG")
+    return ImageFile(image_io, name="upload.png")
+
+
+@pytest.fixture
+def make_post(mixer, user, published_category):
+    def make(color):
+        return mixer.blend(
+            "blog.Post", author=user, category=published_category,
+            image=_image(color),
+        )
+    return make
+
+
+@pytest.fixture
+def release_now(monkeypatch):
+    monkeypatch.setattr(renditions, "IMAGE_RELEASE_DELAY", 0)
+
+
+def _storage():
+    return Post._meta.get_field("image").storage
+
+
+def _exists(name):
+    return _storage().exists(name)
+
+
+def _rendition_names(name):
+    return [
+        renditions.rendition_name(name, size, ext)
+        for size in IMAGE_RENDITIONS for ext in (".png", ".webp")
+    ]
+
+
+def test_identical_uploads_share_one_file(make_post):
+    first, second = make_post((1, 2, 3)), make_post((1, 2, 3))
+    assert first.image.name == second.image.name, (
+        "Убедитесь, что одинаковые загрузки хранятся одним файлом."
+    )
+    assert CONTENT_NAME.search(first.image.name), (
+        "Убедитесь, что имя файла выводится из хэша содержимого."
+    )
+    assert make_post((3, 2, 1)).image.name != first.image.name
+
+
+@pytest.mark.usefixtures("release_now")
+def test_file_deleted_with_last_reference(make_post):
+    first, second = make_post((4, 5, 6)), make_post((4, 5, 6))
+    name = first.image.name
+    call_command("run_worker", once=True)
+
+    first.delete()
+    call_command("run_worker", once=True)
+    assert _exists(name), (
+        "Убедитесь, что файл не удаляется, пока на него ссылаются посты."
+    )
+    second.delete()
+    call_command("run_worker", once=True)
+    assert not _exists(name), (
+        "Убедитесь, что файл удаляется вместе с последним постом."
+    )
+
+
+@pytest.mark.usefixtures("release_now")
+def test_replaced_image_released(make_post):
+    post = make_post((7, 8, 9))
+    name = post.image.name
+    post = Post.objects.get(pk=post.pk)
+    post.image = _image((9, 8, 7))
+    post.save()
+    call_command("run_worker", once=True)
+    assert not _exists(name)
+    assert _exists(post.image.name)
+
+
+def test_recently_uploaded_file_release_is_postponed(make_post):
+    post = make_post((10, 11, 12))
+    name = post.image.name
+    post.delete()
+    call_command("run_worker", once=True)
+    assert _exists(name), (
+        "Убедитесь, что недавно загруженный файл не удаляется сразу: на него"
+        " может ссылаться ещё не сохранённый пост."
+    )
+    job = Task.objects.get(name="release_image", status=Task.PENDING)
+    assert job.payload == {"name": name}
+
+
+@pytest.mark.usefixtures("release_now")
+def test_legacy_image_renditions(mixer, user, published_category):
+    # Файл, загруженный до хэширования имён.
+    image = _image((13, 14, 15))
+    name = FileSystemStorage.save(_storage(), "posts_images/legacy.png", image)
+    post = mixer.blend("blog.Post", author=user, category=published_category)
+    Post.objects.filter(pk=post.pk).update(image=name)
+    post = Post.objects.get(pk=post.pk)
+
+    renditions.build_renditions(post.image)
+    assert all(_exists(copy) for copy in _rendition_names(name)), (
+        "Убедитесь, что копии старого файла сохраняются под именами,"
+        " выведенными из имени оригинала."
+    )
+    cache.clear()
+    assert renditions.get_renditions(post.image) is not None
+
+    post.delete()
+    call_command("run_worker", once=True)
+    assert not any(_exists(copy) for copy in [name, *_rendition_names(name)])
+
+
+@pytest.mark.usefixtures("release_now")
+def test_reuploaded_image_gets_renditions_again(make_post):
+    post = make_post((16, 17, 18))
+    call_command("run_worker", once=True)
+    name = post.image.name
+    stale = renditions.get_renditions(post.image)
+    post.delete()
+    call_command("run_worker", once=True)
+    # Описание копий, которое помнит другой процесс.
+    cache.set(renditions._cache_key(name), stale)
+
+    post = make_post((16, 17, 18))
+    assert post.image.name == name
+    assert renditions.get_renditions(post.image) is None
+    call_command("run_worker", once=True)
+    assert all(_exists(copy) for copy in _rendition_names(name)), (
+        "Убедитесь, что повторная загрузка удалённого файла снова получает"
+        " копии."
+    )
@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from blog import tasks
+from blog.models import Task
+
+pytestmark = [pytest.mark.django_db]
+
+calls = []
+
+
+@tasks.task
+def flaky(fail_times):
+    calls.append(fail_times)
+    if len(calls) <= fail_times:
+        raise RuntimeError("Сбой")
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+def _make_ready(job):
+    Task.objects.filter(pk=job.pk).update(run_at=timezone.now())
+
+
+def test_task_retried_with_backoff():
+    job = tasks.enqueue(flaky, fail_times=1)
+    first = tasks.run_next()
+    assert first.pk == job.pk and first.status == Task.PENDING
+    assert first.run_at > timezone.now(), (
+        "Убедитесь, что повтор задачи откладывается."
+    )
+    assert tasks.run_next() is None
+
+    _make_ready(job)
+    second = tasks.run_next()
+    assert second.status == Task.DONE and second.attempts == 2
+    assert second.finished_at is not None
+
+
+def test_task_fails_after_max_attempts(monkeypatch):
+    monkeypatch.setattr(tasks, "TASK_MAX_ATTEMPTS", 2)
+    job = tasks.enqueue(flaky, fail_times=5)
+    tasks.run_next()
+    _make_ready(job)
+    job = tasks.run_next()
+    assert job.status == Task.FAILED, (
+        "Убедитесь, что задача помечается ошибочной после всех попыток."
+    )
+    assert "RuntimeError" in job.error
+    _make_ready(job)
+    assert tasks.run_next() is None
+
+
+def test_stale_running_task_is_reclaimed():
+    job = tasks.enqueue(flaky, fail_times=0)
+    Task.objects.filter(pk=job.pk).update(
+        status=Task.RUNNING, locked_at=timezone.now() - timedelta(hours=1)
+    )
+    assert tasks.run_next().status == Task.DONE, (
+        "Убедитесь, что задачу упавшего воркера забирает другой."
+    )
+
+
+@pytest.mark.parametrize("stale", [False, True])
+def test_racing_workers_claim_task_once(stale):
+    job = tasks.enqueue(flaky, fail_times=0)
+    if stale:
+        Task.objects.filter(pk=job.pk).update(
+            status=Task.RUNNING,
+            locked_at=timezone.now() - timedelta(hours=1),
+        )
+    # Оба воркера прочитали одну и ту же строку до того, как её забрали.
+    first_now, second_now = timezone.now(), timezone.now()
+    first = tasks._candidates(first_now)
+    second = tasks._candidates(second_now)
+    assert first == second and len(first) == 1
+    taken = [
+        tasks._take(first[0], first_now),
+        tasks._take(second[0], second_now),
+    ]
+    assert taken == [True, False], (
+        "Убедитесь, что задачу получает только один из конкурирующих"
+        " воркеров."
+    )
+    assert Task.objects.get(pk=job.pk).attempts == 1
@@ -0,0 +1,69 @@
+import importlib
+
+import pytest
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+
+from core.checks import check_templates
+from core import templates
+from core.templates import compile_templates, project_engine
+
+
+def _templates(dirs, loaders):
+    return [{
+        **settings.TEMPLATES[0],
+        "DIRS": dirs,
+        "OPTIONS": {**settings.TEMPLATES[0]["OPTIONS"], "loaders": loaders},
+    }]
+
+
+def test_project_templates_compile():
+    timings = compile_templates()
+    names = [name for name, _, _ in timings]
+    assert "base.html" in names and "includes/post_card.html" in names
+    assert all(error is None for _, _, error in timings)
+
+
+def test_cached_loader_keeps_compiled_templates():
+    loaders = [
+        ("django.template.loaders.cached.Loader", settings.TEMPLATE_LOADERS)
+    ]
+    with override_settings(
+        TEMPLATES=_templates(settings.TEMPLATES[0]["DIRS"], loaders)
+    ):
+        compile_templates()
+        cached = project_engine().template_loaders[0].get_template_cache
+        assert "includes/post_card.html" in cached, (
+            "Убедитесь, что скомпилированные шаблоны остаются в cached"
+            " loader."
+        )
+
+
+def test_broken_template_reported(tmp_path):
+    (tmp_path / "broken.html").write_text("{% if %}", encoding="utf-8")
+    with override_settings(
+        TEMPLATES=_templates([tmp_path], settings.TEMPLATE_LOADERS)
+    ):
+        assert [message.id for message in check_templates(None)] == [
+            "core.E001"
+        ]
+        with pytest.raises(CommandError):
+            call_command("template_timings")
+
+
+@pytest.mark.parametrize("module", ["blogicum.wsgi", "blogicum.asgi"])
+@pytest.mark.parametrize("enabled", [True, False])
+def test_entry_points_warm_template_cache(
+    monkeypatch, settings, module, enabled
+):
+    settings.TEMPLATE_CACHE = enabled
+    compiled = []
+    monkeypatch.setattr(
+        templates, "compile_templates", lambda: compiled.append(True)
+    )
+    importlib.reload(importlib.import_module(module))
+    assert bool(compiled) is enabled, (
+        f"Убедитесь, что `{module}` компилирует шаблоны при старте"
+        " только с включённым TEMPLATE_CACHE."
+    )
@@ -0,0 +1,118 @@
+import json
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+
+from blog.models import Category, Comment, Location, Post
+
+pytestmark = [pytest.mark.django_db]
+
+User = get_user_model()
+
+
+def _snapshot():
+    snapshot = {
+        model.__name__: list(model.objects.order_by("pk").values())
+        for model in (User, Category, Location, Post, Comment)
+    }
+    # Сериализаторы Django пишут пустой файл как "", а не NULL.
+    for post in snapshot["Post"]:
+        post["image"] = post["image"] or ""
+    return snapshot
+
+
+def _clear():
+    for model in (Comment, Post, Location, Category, User):
+        model.objects.all().delete()
+
+
+@pytest.fixture
+def exported(tmp_path):
+    call_command(
+        "seed_blog", verbosity=0, users=10, categories=3, locations=3,
+        posts=50, comments=200,
+    )
+    snapshot = _snapshot()
+    path = tmp_path / "blog.jsonl"
+    call_command("export_blog", output=str(path), chunk_size=7)
+    _clear()
+    return path, snapshot
+
+
+def test_export_import_round_trip(exported):
+    path, snapshot = exported
+    call_command("import_blog", str(path), batch_size=16, verbosity=0)
+    assert _snapshot() == snapshot, (
+        "Убедитесь, что `import_blog` восстанавливает выгрузку `export_blog`"
+        " с теми же первичными ключами."
+    )
+    assert not path.with_name("blog.jsonl.progress").exists()
+
+
+def test_import_resumes_after_interruption(exported):
+    path, snapshot = exported
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    broken_at = len(lines) - 30
+    good_line = lines[broken_at]
+    lines[broken_at] = "{oops\n"
+    path.write_text("".join(lines), encoding="utf-8")
+
+    with pytest.raises(CommandError):
+        call_command("import_blog", str(path), batch_size=16, verbosity=0)
+    assert 0 < Comment.objects.count() < len(snapshot["Comment"])
+
+    lines[broken_at] = good_line
+    path.write_text("".join(lines), encoding="utf-8")
+    call_command("import_blog", str(path), batch_size=16, verbosity=0)
+    assert _snapshot() == snapshot, (
+        "Убедитесь, что повторный запуск `import_blog` продолжает прерванную"
+        " загрузку."
+    )
+
+
+def test_import_rejects_conflicting_rows(exported, mixer):
+    path, snapshot = exported
+    taken = snapshot["Category"][0]
+    mixer.blend("blog.Category", slug=taken["slug"])
+    with pytest.raises(CommandError):
+        call_command("import_blog", str(path), batch_size=16, verbosity=0)
+    assert not Category.objects.filter(pk=taken["id"]).exists(), (
+        "Убедитесь, что `import_blog` не пропускает молча строки,"
+        " конфликтующие с данными в базе."
+    )
+
+
+def test_import_rejects_other_row_with_same_pk(exported):
+    path, snapshot = exported
+    exported_user = snapshot["User"][0]
+    User.objects.create(pk=exported_user["id"], username="admin")
+    with pytest.raises(CommandError):
+        call_command("import_blog", str(path), batch_size=16, verbosity=0)
+    assert not Post.objects.filter(author__username="admin").exists(), (
+        "Убедитесь, что `import_blog` не привязывает объекты выгрузки к"
+        " чужой строке с тем же первичным ключом."
+    )
+
+
+def test_import_replays_batch_saved_before_progress(exported):
+    path, snapshot = exported
+    call_command("import_blog", str(path), batch_size=16, verbosity=0)
+    # Пакет записан, но прогресс прерванного запуска остался перед ним.
+    lines = path.read_bytes().splitlines(keepends=True)
+    last_batch = len(lines) - len(snapshot["Comment"]) % 16
+    offset = sum(len(line) for line in lines[:last_batch])
+    path.with_name("blog.jsonl.progress").write_text(
+        json.dumps({"offset": offset})
+    )
+    call_command("import_blog", str(path), batch_size=16, verbosity=0)
+    assert _snapshot() == snapshot
+
+
+def test_export_to_stdout(exported):
+    path, snapshot = exported
+    call_command("import_blog", str(path), verbosity=0)
+    out = StringIO()
+    call_command("export_blog", stdout=out)
+    assert out.getvalue() == path.read_text(encoding="utf-8")